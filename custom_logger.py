@@ -10,6 +10,16 @@ import yaml
 # Enable Rich's pretty tracebacks globally
 rich_traceback_install(show_locals=True)
 
+# Level names used by log_message, mapped to their numbers. logging.getLevelName
+# would return a string for an unknown name instead.
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 class Logger:
     """
@@ -87,6 +97,9 @@ class Logger:
         file_handler.setFormatter(file_formatter)
         self.logger.addHandler(file_handler)
 
+        # Lowest level any of the logger's handlers accepts
+        self.min_log_level = self.file_log_level
+
         # Conditionally add console handler if noConsole is False
         if not self.config.get("noConsole", False):
             self.console_log_level = getattr(
@@ -94,6 +107,7 @@ class Logger:
                 self.config.get("console_log_level", "INFO").upper(),
                 logging.INFO,
             )
+            self.min_log_level = min(self.min_log_level, self.console_log_level)
             console_handler = RichHandler(show_path=False, markup=True)
             console_handler.setLevel(self.console_log_level)
 
@@ -149,76 +163,106 @@ class Logger:
         use_emojis=True,
         prepend_label=True,
         noConsole=False,
+        args=(),
         **kwargs,
     ):
         """
         Unified log message handler to be called by log methods like debug, info, etc.
         Logs to both file and console unless `noConsole=True`.
+        A `noConsole` message below every handler's level would go nowhere, so it is
+        dropped up front; `message % args` is only formatted for messages that are kept.
         """
-        formatted_message = self.format_console_message(
-            level, message, use_emojis, prepend_label
-        )
+        levelno = _LEVELS[level]
+        if noConsole and levelno < self.min_log_level:
+            return
+        if args:
+            message = message % args
 
         # Print to console only if noConsole is False
         if not noConsole:
+            formatted_message = self.format_console_message(
+                level, message, use_emojis, prepend_label
+            )
             console_print(formatted_message, **kwargs)
 
         # Log the message to the file
-        log_method = getattr(self.logger, level.lower())
-        log_method(message)
+        self.logger.log(levelno, message)
 
     def debug(
-        self, message, use_emojis=True, prepend_label=True, noConsole=False, **kwargs
+        self,
+        message,
+        *args,
+        use_emojis=True,
+        prepend_label=True,
+        noConsole=False,
+        **kwargs,
     ):
         self.log_message(
-            "DEBUG", message, use_emojis, prepend_label, noConsole, **kwargs
+            "DEBUG", message, use_emojis, prepend_label, noConsole, args, **kwargs
         )
 
     def info(
-        self, message, use_emojis=True, prepend_label=False, noConsole=False, **kwargs
+        self,
+        message,
+        *args,
+        use_emojis=True,
+        prepend_label=False,
+        noConsole=False,
+        **kwargs,
     ):
         self.log_message(
-            "INFO", message, use_emojis, prepend_label, noConsole, **kwargs
+            "INFO", message, use_emojis, prepend_label, noConsole, args, **kwargs
         )
 
     def warning(
-        self, message, use_emojis=True, prepend_label=True, noConsole=False, **kwargs
+        self,
+        message,
+        *args,
+        use_emojis=True,
+        prepend_label=True,
+        noConsole=False,
+        **kwargs,
     ):
         self.log_message(
-            "WARNING", message, use_emojis, prepend_label, noConsole, **kwargs
+            "WARNING", message, use_emojis, prepend_label, noConsole, args, **kwargs
         )
 
     def error(
-        self, message, use_emojis=True, prepend_label=True, noConsole=False, **kwargs
+        self,
+        message,
+        *args,
+        use_emojis=True,
+        prepend_label=True,
+        noConsole=False,
+        **kwargs,
     ):
         self.log_message(
-            "ERROR", message, use_emojis, prepend_label, noConsole, **kwargs
+            "ERROR", message, use_emojis, prepend_label, noConsole, args, **kwargs
         )
 
     def critical(
-        self, message, use_emojis=True, prepend_label=True, noConsole=False, **kwargs
+        self,
+        message,
+        *args,
+        use_emojis=True,
+        prepend_label=True,
+        noConsole=False,
+        **kwargs,
     ):
         self.log_message(
-            "CRITICAL", message, use_emojis, prepend_label, noConsole, **kwargs
+            "CRITICAL", message, use_emojis, prepend_label, noConsole, args, **kwargs
         )
 
 
-# Singleton pattern to ensure one logger instance
-logger_instance = None
-
-
 def get_logger():
     """
-    Retrieves a singleton instance of the logger to ensure only one logger is used
-    throughout the application.
+    Retrieves the underlying logging.Logger of the module-level `log` instance, so
+    only one Logger (one log file, one set of handlers) exists per process.
 
     Returns:
-    Logger: The singleton logger instance.
+    logging.Logger: The shared logger.
     """
-    global logger_instance
-    if not logger_instance:
-        logger_instance = Logger().logger  # Access the .logger attribute directly
-    return logger_instance
+    return log.logger
 
 
 # Create an instance of Logger for direct use
@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
+import calendar
+import collections
+import errno
+import functools
 import os
 import re
 import shutil
 import sys
+import threading
 import yaml
 import subprocess
+from dataclasses import dataclass, replace
 from datetime import datetime
-from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from rich.prompt import Prompt, Confirm
 from rich.progress import Progress
 from rich.traceback import install
@@ -15,16 +21,360 @@ from custom_logger import log  # New logger
 from rich.console import Console
 import questionary
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 install(show_locals=True)  # Rich traceback for enhanced debugging
 console = Console()
 
+# Translation table used when turning a cleaned title into a dashed slug
+_TITLE_TRANS = str.maketrans({" ": "-", ".": "-", "_": "-"})
+# Separators clean_text turns into spaces
+_CLEAN_TRANS = str.maketrans({"_": " ", "-": " ", ".": " "})
+# Translation table for filename and folder parts (spaces become dashes)
+_SPACE_TRANS = str.maketrans({" ": "-"})
+
+# Patterns used on every file, compiled once at import time
+_RE_RELEASE_GROUP = re.compile(r"\[([A-Za-z0-9_]+)\]|[-_]([A-Za-z0-9_]+)$")
+_RE_DATE_PART = re.compile(r"(\d{4}-\d{2}-\d{2})([a-zA-Z])?")
+_RE_MULTI_DASH = re.compile(r"-+")
+_RE_MULTI_DOT = re.compile(r"\.{2,}")
+_RE_YEAR_OR_TWO = re.compile(r"\d{4}|\d{2}")
+_RE_WORDS = re.compile(r"([A-Za-z\s]+)")
+
+# Date and season patterns
+_RE_DATE_WITH_PART = re.compile(r"(\d{2,4}[._-]\d{2}[._-]\d{2})([a-zA-Z])?")
+_RE_INCOMPLETE_DATE = re.compile(r"(\d{2})\.(\d{2})\.(\d{2})([A-Za-z]?)")
+_RE_YEAR = re.compile(r"(19|20)\d{2}")
+_RE_YEAR_RANGE = re.compile(r"(19|20)\d{2}-(19|20)\d{2}")
+_RE_DATE_FIELDS = re.compile(r"^(\d{2,4})([._-])(\d{1,2})\2(\d{1,4})$")
+
+# 2-digit year -> 4-digit year string for delimited dates. Taken from strptime's %y
+# (00-68 -> 20xx, 69-99 -> 19xx), which the old format list parsed them with.
+_YY_TO_YYYY = tuple(
+    str(datetime.strptime(f"{yy:02d}", "%y").year) for yy in range(100)
+)
+# Same lookup for incomplete dates (87.04.22A), which have always used their own
+# pivot: 51-99 -> 19xx, 00-50 -> 20xx
+_INCOMPLETE_YY_TO_YYYY = tuple(
+    f"{'19' if yy > 50 else '20'}{yy:02d}" for yy in range(100)
+)
+
+# Days per month, indexed by month number (February leap days handled separately)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Slots a file can't be organized without ("unknown" in any case marks them missing)
+_QUARANTINE_CRITICAL_FIELDS = ("league_name", "air_year", "episode_title")
+
+# Known date formats, only used when _RE_DATE_FIELDS can't split the string
+_DATE_FORMATS = (
+    "%Y.%m.%d",
+    "%Y-%m-%d",
+    "%d.%m.%Y",
+    "%d-%m-%Y",
+    "%Y_%m_%d",
+    "%d%m%Y",
+    "%y.%m.%d",
+    "%d.%m.%y",
+    "%d-%m-%y",  # 2-digit years (e.g., 87.04.22)
+)
+
+# Codec/container tokens that are never release groups (already lowercased)
+_COMMON_RELEASE_PATTERNS = ("x264", "x265", "mp4", "mkv", "webrip")
+
+# Files smaller than this can't be real video, so ffprobe is never spawned for them
+_FFPROBE_MIN_BYTES = 1_000_000
+
+# Dry run reports are written through a 1 MiB buffer, one write per entry
+_REPORT_BUFFER_SIZE = 1 << 20
+
+# Part letter after a date -> part label ('a'/'A' -> part-01, 'b'/'B' -> part-02, ...)
+_PART_LABELS = {
+    letter: f"part-{index:02d}"
+    for index, lower in enumerate("abcdefghijklmnopqrstuvwxyz", start=1)
+    for letter in (lower, lower.upper())
+}
+
+
+@functools.lru_cache(maxsize=8192)
+def _scan_date_part(filename):
+    """
+    Run _RE_DATE_PART once per filename and share the result between the title
+    and episode-part extractors. Returns (matched_text, date, part_letter) or None.
+    """
+    match = _RE_DATE_PART.search(filename)
+    if match:
+        return match.group(0), match.group(1), match.group(2)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _known_components_regex(elements):
+    """
+    Compile one alternation that removes every known component in a single pass.
+    Longest strings go first so e.g. a year is stripped before a two-digit day
+    that happens to be a substring of it. Files from the same event share the
+    same components, so the compiled pattern is reused across a batch.
+    """
+    ordered = sorted(set(elements), key=len, reverse=True)
+    return re.compile("|".join(re.escape(element) for element in ordered))
+
+
+@functools.lru_cache(maxsize=8192)
+def _date_extract_from_string(date_str):
+    """
+    Extract the date from a string using known formats.
+    Handles 2-digit years and part numbers. Pure, so results are memoized.
+    Returns (air_year, air_month, air_day, season_name, part_number, confidence).
+    """
+    air_year = air_month = air_day = season_name = part_number = ""
+    confidence = 0
+
+    if not date_str:
+        return "", "", "", "", "", confidence
+
+    # Regex to extract part number (e.g., 87.04.22A -> 1987.04.22, Part A)
+    part_number_match = _RE_DATE_WITH_PART.search(date_str)
+    if part_number_match:
+        date_str = part_number_match.group(1)
+        part_number = part_number_match.group(2) or ""
+
+    # Fast path: split "NN.NN.NN" / "NNNN-NN-NN" style strings into fields directly
+    match = _RE_DATE_FIELDS.match(date_str)
+    fields = _date_fields_from_match(match) if match else _date_fields_strptime(date_str)
+    if fields is None:
+        return "", "", "", "", "", confidence
+
+    air_year, air_month, air_day = fields
+    season_name = f"Season {air_year}"
+    confidence = 90
+    return air_year, air_month, air_day, season_name, part_number, confidence
+
+
+def _date_fields_from_match(match):
+    """
+    Turn a _RE_DATE_FIELDS match into zero-padded (year, month, day) strings, or None
+    if it isn't a valid date. The matched digits are reused as-is where possible.
+    Field widths decide the order: a 4-digit first field is Y-M-D, a 4-digit last
+    field is D-M-Y. All-2-digit dates follow the old format list: dots try
+    yy.mm.dd before dd.mm.yy, dashes only allow dd-mm-yy.
+    """
+    first, delimiter, month, last = match.groups()
+    if len(first) == 4 and len(last) <= 2:
+        orders = ((first, last),)
+    elif len(first) == 2 and len(last) == 4 and delimiter in ".-":
+        orders = ((last, first),)
+    elif len(first) == 2 and len(last) == 2 and delimiter == ".":
+        orders = ((first, last), (last, first))
+    elif len(first) == 2 and len(last) == 2 and delimiter == "-":
+        orders = ((last, first),)
+    else:
+        return None
+
+    month_num = int(month)
+    if not 1 <= month_num <= 12:
+        return None
+    for year_str, day_str in orders:
+        if len(year_str) == 2:
+            # Handle 2-digit years (e.g., 87 -> 1987, 12 -> 2012)
+            year_str = _YY_TO_YYYY[int(year_str)]
+        year_num = int(year_str)
+        days_in_month = _DAYS_IN_MONTH[month_num]
+        if month_num == 2 and calendar.isleap(year_num):
+            days_in_month = 29
+        if year_num >= 1 and 1 <= int(day_str) <= days_in_month:
+            return year_str, month.zfill(2), day_str.zfill(2)
+    return None
+
+
+def _date_fields_strptime(date_str):
+    """
+    Slow fallback for strings the field regex doesn't cover (e.g. "22041987").
+    Tries each known strptime format in turn; returns (year, month, day) strings
+    or None.
+    """
+    for fmt in _DATE_FORMATS:
+        try:
+            dt = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        return str(dt.year), f"{dt.month:02d}", f"{dt.day:02d}"
+    return None
+
+
+@functools.lru_cache(maxsize=16384)
+def _split_ext(file_path):
+    """
+    Split a path into (filename without extension, extension without the dot).
+    Each path is split several times per run (scan, ffprobe prefetch, extraction),
+    so results are memoized.
+    """
+    filename, extension = os.path.splitext(os.path.basename(file_path))
+    return filename, extension.lstrip(".")
+
+
+@functools.lru_cache(maxsize=8192)
+def _date_handle_incomplete(filename):
+    """
+    Handle incomplete dates (e.g., 87.04.22A -> Part A). Pure, so results are memoized.
+    Handles 2-digit year formats and returns (air_year, air_month, air_day, part_number).
+    """
+    air_year = air_month = air_day = part_number = ""
+
+    # Cheap pre-screen: the pattern needs at least two dots, so skip the regex otherwise
+    if filename.count(".") < 2:
+        return "", "", "", ""
+
+    # Regex to match incomplete date formats (e.g., 87.04.22A)
+    match = _RE_INCOMPLETE_DATE.search(filename)
+    if match:
+        # Handle 2-digit year (e.g., 87 -> 1987)
+        air_year = _INCOMPLETE_YY_TO_YYYY[int(match.group(1))]
+        air_month = match.group(2)
+        air_day = match.group(3)
+        part_number = match.group(4).upper() if match.group(4) else ""
+        return air_year, air_month, air_day, part_number
+
+    return "", "", "", ""
+
+
+def _date_year_from_directory(parent_dir):
+    """
+    Return the left-most 19xx/20xx year in a directory path, or None. Every parent
+    is a prefix of the immediate directory, so one search covers the whole tree.
+    """
+    # Cheap pre-screen: no "19"/"20" means no year anywhere up the tree
+    if "19" not in parent_dir and "20" not in parent_dir:
+        return None
+    year_match = _RE_YEAR.search(parent_dir)
+    return year_match.group(0) if year_match else None
+
+
+@functools.lru_cache(maxsize=8192)
+def _date_and_season(date_str, filename, parent_dir):
+    """
+    Pure body of date_extract_date_and_season, memoized on hashable strings.
+    Returns (air_year, air_month, air_day, season_name, part_number, confidence,
+    source), where source names the step that found the date ("string",
+    "incomplete" or "directory", None if nothing did). Nothing is logged here,
+    so the caller can log on every call, cache hits included.
+    """
+    # Step 1: Extract the Date from the String
+    extracted = _date_extract_from_string(date_str)
+    if extracted[0]:
+        return (*extracted, "string")
+
+    # Step 2: Handle Incomplete Dates (e.g., 87.04.22A -> 1987, part A)
+    air_year, air_month, air_day, part_number = _date_handle_incomplete(filename)
+    if air_year:
+        season_name = f"Season {air_year}"
+        return air_year, air_month, air_day, season_name, part_number, 70, "incomplete"
+
+    # Step 3: Infer Year from Directory Structure
+    air_year = _date_year_from_directory(parent_dir)
+    if air_year:
+        return air_year, "", "", f"Season {air_year}", "", 50, "directory"
+
+    # Step 4: Fallback to Unknown
+    return "Unknown", "", "", "Unknown Season", "", 0, None
+
+
+def _submit_bounded(executor, fn, items, max_in_flight):
+    """
+    Submit fn(item) for each item while keeping at most max_in_flight futures
+    pending, yielding (item, future) pairs as they complete. Items are pulled
+    lazily, so memory stays O(max_in_flight) however long the input is.
+    """
+    in_flight = collections.deque()
+
+    def drain():
+        done, _ = wait([future for _, future in in_flight], return_when=FIRST_COMPLETED)
+        completed = [pair for pair in in_flight if pair[1] in done]
+        remaining = [pair for pair in in_flight if pair[1] not in done]
+        in_flight.clear()
+        in_flight.extend(remaining)
+        return completed
+
+    for item in items:
+        in_flight.append((item, executor.submit(fn, item)))
+        if len(in_flight) >= max_in_flight:
+            yield from drain()
+    while in_flight:
+        yield from drain()
+
+
+@dataclass(slots=True)
+class Slots:
+    """
+    Metadata slots extracted for a single file.
+    Fields live in fixed __slots__ storage rather than a per-file dict,
+    so reads and writes are plain attribute accesses.
+    """
+
+    league_name: str = "Unknown"
+    event_name: str = ""
+    air_year: str = ""
+    air_month: str = ""
+    air_day: str = ""
+    season_name: str = ""
+    episode_title: str = ""
+    episode_part: str = ""
+    codec: str = ""
+    resolution: str = ""
+    release_format: str = ""
+    release_group: str = ""
+    extension_name: str = ""
+    sport: str = None
+    sport_category: str = None
+    confidence: float = 0
+
+    def items(self):
+        """
+        Yield (slot_name, value) pairs in declaration order, like dict.items().
+        """
+        return ((name, getattr(self, name)) for name in self.__slots__)
+
+    def reset(self, extension_name=""):
+        """
+        Restore every slot to its default in place so the object can be reused.
+        """
+        Slots.__init__(self, extension_name=extension_name)
+
 
 class SportsMediaOrganizer:
     def __init__(self):
         # Directory for YAML config files
         yaml_directory = os.path.join(os.getcwd(), "configs")
-        self.slots = {}
-        self.dry_run_actions = []  # Initialize an empty list to track dry run actions
+        # Per-sport YAMLs, resolved once (same folder ConfigManager reads)
+        self._sports_dir = os.path.join(yaml_directory, "overrides", "sports")
+        self.slots = Slots()
+        self._episode_part_rules = []  # (part key, compiled pattern) from episode_parts.yaml
+        self._slots_pool = threading.local()  # One reusable Slots per worker thread
+        self.selected_sport = None  # Chosen once in prompt_user_for_options
+        # Appended to from worker threads; deque appends are atomic, len() is the count
+        self.dry_run_actions = collections.deque()  # Planned dry run actions
+        self.processed_files = collections.deque()  # Sources processed (or planned)
+        self.failed_files = collections.deque()  # Sources that failed or were blocked
+        self._created_folders = set()  # Destination folders already ensured this run
+        self._claimed_dest_paths = set()  # Move destinations taken this run
+        self._dest_lock = threading.Lock()  # Guards the exists-check + move pair
+        self._folder_cache = {}  # (root, sport, league, season) -> destination folder
+        self._yaml_cache = {}  # path -> (st_mtime_ns, parsed YAML)
+        self._ffprobe_cache = {}  # file path -> ffprobe output lines
+        self._release_group_lock = threading.Lock()  # Serializes release-groups.yaml writes
+        self._pattern_regex_cache = {}  # id(yaml dict) -> (dict, regex, keys, leftovers)
+        # Files from the same release share name tokens, so memoize the YAML lookups
+        self.codec_match_from_yaml = functools.lru_cache(maxsize=4096)(
+            self.codec_match_from_yaml
+        )
+        # Cleared whenever a release group is added, so new groups are seen at once
+        self.release_group_match_from_yaml = functools.lru_cache(maxsize=4096)(
+            self.release_group_match_from_yaml
+        )
         # Load configuration with default values
         self.config = self.load_yaml_config(
             "config.yaml",
@@ -44,6 +394,36 @@ class SportsMediaOrganizer:
             },
         )
 
+        # Normalize extension lists once (".MKV" and "mkv" both become "mkv")
+        self._allowed_extensions = frozenset(
+            ext.lower().lstrip(".")
+            for ext in self.config.get("allowed_extensions", [])
+        )
+        # config.yaml spells it "block_extensions", the built-in defaults "blocked_extensions"
+        self._blocked_extensions = frozenset(
+            ext.lower().lstrip(".")
+            for ext in self.config.get(
+                "block_extensions", self.config.get("blocked_extensions", [])
+            )
+        )
+        # Quarantine settings are fixed for the run, no per-file config lookups
+        self._quarantine_enabled = self.config.get("quarantine_enabled", True)
+        self._quarantine_threshold = self.config.get("quarantine_threshold", 50)
+        self._pre_run_substitutions, self._pre_run_filters = (
+            self.pre_run_compile_rules()
+        )
+        # Substitutions are fixed for the run and applied twice per file
+        self.pre_run_substitute = functools.lru_cache(maxsize=16384)(
+            self.pre_run_substitute
+        )
+        # Only a handful of distinct extensions ever show up, so cache the verdicts
+        self.extension_is_blocked = functools.lru_cache(maxsize=64)(
+            self.extension_is_blocked
+        )
+        self.extension_is_allowed = functools.lru_cache(maxsize=64)(
+            self.extension_is_allowed
+        )
+
         # Only load YAML files necessary for current functionality
         try:
             # Load essential YAML files for processing (release types, resolutions, codecs, etc.)
@@ -60,6 +440,11 @@ class SportsMediaOrganizer:
                 os.path.join(yaml_directory, "leagues.yaml")
             )
 
+            # Optional: episode part overrides, compiled once for the whole run
+            self._episode_part_rules = self.episode_part_compile_rules(
+                os.path.join(yaml_directory, "episode_parts.yaml")
+            )
+
             # Optional: handle any post-loading operations here if necessary
             log.info("Successfully loaded all config files.")
 
@@ -70,10 +455,22 @@ class SportsMediaOrganizer:
         """
         Load a YAML configuration file.
         If it's the main config file (config.yaml) and fails to load, use the provided default_config.
+        Parsed files are cached by modification time, so repeated loads of an
+        unchanged file skip the read and parse entirely. Mappings come back as
+        read-only MappingProxyType views of the cached dict; copy before mutating.
         """
         try:
+            mtime = os.stat(file_name).st_mtime_ns
+            cached = self._yaml_cache.get(file_name)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
             with open(file_name, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+                data = yaml.load(f.read(), Loader=SafeLoader) or {}
+            if isinstance(data, dict):
+                data = MappingProxyType(data)
+            self._yaml_cache[file_name] = (mtime, data)
+            return data
         except (FileNotFoundError, yaml.YAMLError) as e:
             log.error(f"Error loading {file_name}: {e}")
 
@@ -84,33 +481,32 @@ class SportsMediaOrganizer:
 
             return {}  # Return empty dict for non-config files
 
-        # def load_overrides(self):
-        #     overrides = {"global": {}, "sports": {}}
-        #     global_override_file = os.path.join("overrides", "global_overrides.yaml")
-        #     if os.path.exists(global_override_file):
-        #         try:
-        #             with open(global_override_file, "r", encoding="utf-8") as f:
-        #                 overrides["global"] = yaml.safe_load(f) or {}
-        #                 log.info(f"Global overrides loaded from {global_override_file}")
-        #         except yaml.YAMLError as e:
-        #             log.error(f"Error loading global overrides: {e}")
-
-        sport_overrides_dir = os.path.join("overrides", "sports")
-        if os.path.isdir(sport_overrides_dir):
-            for file in os.listdir(sport_overrides_dir):
-                if file.endswith(".yaml"):
-                    sport_name = file.replace(".yaml", "")
-                    try:
-                        with open(
-                            os.path.join(sport_overrides_dir, file),
-                            "r",
-                            encoding="utf-8",
-                        ) as f:
-                            overrides["sports"][sport_name] = yaml.safe_load(f) or {}
-                    except yaml.YAMLError as e:
-                        log.error(
-                            f"Error loading sport overrides for '{sport_name}': {e}"
+    def load_overrides(self):
+        """
+        Load per-sport override files from configs/overrides/sports/.
+        Returns a dict of the form {"global": {}, "sports": {sport_name: data}}.
+        """
+        overrides = {"global": {}, "sports": {}}
+        # global_override_file = os.path.join("overrides", "global_overrides.yaml")
+        # if os.path.exists(global_override_file):
+        #     try:
+        #         with open(global_override_file, "r", encoding="utf-8") as f:
+        #             overrides["global"] = yaml.safe_load(f) or {}
+        #             log.info(f"Global overrides loaded from {global_override_file}")
+        #     except yaml.YAMLError as e:
+        #         log.error(f"Error loading global overrides: {e}")
+
+        try:
+            # scandir hands back each entry's full path, so no per-file join or stat
+            with os.scandir(self._sports_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".yaml"):
+                        sport_name = entry.name[: -len(".yaml")]
+                        overrides["sports"][sport_name] = self.load_yaml_config(
+                            entry.path
                         )
+        except (FileNotFoundError, NotADirectoryError):
+            pass  # No sport overrides directory
 
         return overrides
 
@@ -127,29 +523,20 @@ class SportsMediaOrganizer:
         - extension (str): File extension.
         - logging_enabled (bool): Toggle for logging slot initialization.
         """
-        slots = {
-            "league_name": "Unknown",
-            "event_name": "",
-            "air_year": "",
-            "air_month": "",
-            "air_day": "",
-            "season_name": "",
-            "episode_title": "",
-            "episode_part": "",
-            "codec": "",
-            "resolution": "",
-            "release_format": "",
-            "release_group": "",
-            "extension_name": extension,
-        }
+        # Reuse this thread's Slots instead of allocating one per file; callers that
+        # keep slots past the next file must take a copy (see slots_extract_detached)
+        slots = getattr(self._slots_pool, "slots", None)
+        if slots is None:
+            slots = self._slots_pool.slots = Slots()
+        slots.reset(extension)
 
         if logging_enabled:
-            log.debug(f"Initialized slots: {slots}")
+            log.debug("Initialized slots: %s", slots)
 
         return slots
 
     def slots_extract_and_populate(
-        self, filename, file_path, extension, logging_enabled=True
+        self, filename, file_path, extension, logging_enabled=True, sport=None
     ):
         """
         Controller method to extract information from the filename and path to populate slots.
@@ -160,39 +547,40 @@ class SportsMediaOrganizer:
         - file_path (str): The full file path.
         - extension (str): File extension.
         - logging_enabled (bool): Toggle for logging.
+        - sport (str): Sport decided up front for this file; defaults to the startup choice.
         """
         # Step 1: Initialize slots
         slots = self.slots_initialize(extension, logging_enabled)
 
         try:
-            # Step 2: Extract sport from user prompt
-            slots["sport"] = prompt_for_sport()
+            # Step 2: Use the sport decided before extraction (never prompt per file)
+            slots.sport = sport or self.selected_sport
 
             # Step 3: Extract league and apply overrides
-            slots["league_name"], league_confidence = (
+            slots.league_name, league_confidence = (
                 self.league_infer_or_extract_league("", file_path)
             )
 
             # Step 4: Extract date, season, and part number (keep date_confidence)
             (
-                slots["air_year"],
-                slots["air_month"],
-                slots["air_day"],
-                slots["season_name"],
-                slots["episode_part"],
+                slots.air_year,
+                slots.air_month,
+                slots.air_day,
+                slots.season_name,
+                slots.episode_part,
                 date_confidence,
             ) = self.date_extract_date_and_season("", filename, file_path)
 
             # Step 5: Extract codec, resolution, and release format
-            slots["codec"], slots["resolution"], slots["release_format"] = (
-                self.codec_extract_from_filename(filename)
+            slots.codec, slots.resolution, slots.release_format = (
+                self.codec_extract_from_filename(filename, file_path)
             )
 
             # Step 6: Extract release group
-            slots["release_group"] = self.release_group_extract_from_filename(filename)
+            slots.release_group = self.release_group_extract_from_filename(filename)
 
             # Step 7: Calculate confidence, using both league and date confidence
-            slots["confidence"] = (
+            slots.confidence = (
                 self.confidence_calculate_overall_confidence(slots) + date_confidence
             )
 
@@ -201,10 +589,62 @@ class SportsMediaOrganizer:
             return None  # Early return in case of failure
 
         if logging_enabled:
-            log.debug(f"Extracted slots: {slots}")
+            log.debug("Extracted slots: %s", slots)
 
         return slots
 
+    def slots_extract_batch(
+        self, file_paths, logging_enabled=False, sport_by_dir=None
+    ):
+        """
+        Extract slots for many files concurrently. The per-file work is dominated by
+        ffprobe subprocesses and file stats, so threads overlap the waiting.
+        Config dictionaries are only read during extraction, so they are shared as-is.
+
+        Args:
+        - file_paths (list): Full paths of the files to extract.
+        - logging_enabled (bool): Toggle for per-file logging.
+        - sport_by_dir (dict): Optional folder -> sport mapping from prompt_sport_by_directory.
+
+        Returns:
+        dict: Mapping of file path to its slots (None if extraction failed).
+        """
+        results = {}
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        def extract(file_path):
+            filename, extension = self.get_filename_and_extension(file_path)
+            sport = None
+            if sport_by_dir:
+                sport = sport_by_dir.get(self.library_top_folder(file_path))
+            return self.slots_extract_detached(
+                filename,
+                file_path,
+                extension,
+                logging_enabled=logging_enabled,
+                sport=sport,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, future in _submit_bounded(
+                executor, extract, file_paths, max_workers * 4
+            ):
+                results[file_path] = future.result()
+
+        return results
+
+    def slots_extract_detached(
+        self, filename, file_path, extension, logging_enabled=True, sport=None
+    ):
+        """
+        Extract slots and return a private copy, detached from the thread's pooled
+        instance, for callers that hold on to results across files.
+        """
+        slots = self.slots_extract_and_populate(
+            filename, file_path, extension, logging_enabled, sport
+        )
+        return replace(slots) if slots else None
+
     def slots_post_process(self, slots, logging_enabled=True):
         """
         Post-process the slots to clean up any inconsistencies or apply final overrides.
@@ -216,11 +656,11 @@ class SportsMediaOrganizer:
         """
         try:
             # Step 1: Clean up episode title and apply final substitutions
-            slots["episode_title"] = self.episode_title_clean(slots["episode_title"])
+            slots.episode_title = self.episode_title_clean(slots.episode_title)
 
             # Step 2: Apply any sport-specific overrides
             slots = self.apply_sport_overrides(
-                slots, slots["episode_title"], slots["event_name"]
+                slots, slots.episode_title, slots.event_name
             )
 
         except Exception as e:
@@ -228,7 +668,7 @@ class SportsMediaOrganizer:
             return slots  # Return slots even if post-processing fails
 
         if logging_enabled:
-            log.debug(f"Post-processed slots: {slots}")
+            log.debug("Post-processed slots: %s", slots)
 
         return slots
 
@@ -238,11 +678,11 @@ class SportsMediaOrganizer:
         """
         extension = self.extension_extract_and_validate(filename)
         if extension:
-            self.slots["extension_name"] = (
+            self.slots.extension_name = (
                 extension  # Populate the slot with valid extension
             )
         else:
-            self.slots["extension_name"] = (
+            self.slots.extension_name = (
                 "Unknown"  # Handle cases where extension is invalid
             )
 
@@ -250,19 +690,21 @@ class SportsMediaOrganizer:
     # CODEC FLOWS #
     ###############
 
-    def codec_extract_from_filename(self, filename):
+    def codec_extract_from_filename(self, filename, file_path=None):
         """
         Extract codec, resolution, and release format from the filename using patterns defined in the YAML files.
         If one of the fields is missing, fall back to ffprobe for metadata extraction.
+        ffprobe is run against file_path when given, otherwise against filename.
         """
         # Step 1: Match codec, resolution, and release format from YAML
-        codec = self.match_pattern_from_yaml(self.codecs, filename)
-        resolution = self.match_pattern_from_yaml(self.resolutions, filename)
-        release_format = self.match_pattern_from_yaml(self.release_types, filename)
+        codec, resolution, release_format = self.codec_match_from_yaml(filename)
 
         # Step 2: Log details about the extraction process
         log.debug(
-            f"Extracted from filename - Codec: {codec}, Resolution: {resolution}, Release Format: {release_format}"
+            "Extracted from filename - Codec: %s, Resolution: %s, Release Format: %s",
+            codec,
+            resolution,
+            release_format,
         )
 
         # Step 3: If both codec and resolution are found in the filename, return them and skip ffprobe
@@ -274,8 +716,104 @@ class SportsMediaOrganizer:
 
         # Step 4: Use ffprobe for the missing fields
         return self.codec_extract_with_ffprobe(
-            filename, codec, resolution, release_format
+            file_path or filename, codec, resolution, release_format
+        )
+
+    def codec_match_from_yaml(self, filename):
+        """
+        Match codec, resolution, and release format against the YAML patterns.
+        Wrapped in a per-instance lru_cache in __init__, keyed by filename.
+        Returns a (codec, resolution, release_format) tuple.
+        """
+        return (
+            self.match_pattern_from_yaml(self.codecs, filename),
+            self.match_pattern_from_yaml(self.resolutions, filename),
+            self.match_pattern_from_yaml(self.release_types, filename),
+        )
+
+    def codec_needs_ffprobe(self, filename):
+        """
+        Check whether the filename alone is missing codec or resolution info,
+        meaning ffprobe would have to be consulted for it.
+        """
+        codec, resolution, _ = self.codec_match_from_yaml(filename)
+        return not (codec and resolution)
+
+    def codec_is_worth_probing(self, file_path):
+        """
+        Check the file size before spawning ffprobe. Stray tiny files (samples,
+        placeholders) that slipped past the extension check aren't worth a process.
+        """
+        try:
+            return os.stat(file_path).st_size >= _FFPROBE_MIN_BYTES
+        except OSError:
+            return False
+
+    def codec_run_ffprobe(self, file_path):
+        """
+        Run ffprobe on a single file and return its output lines
+        (codec name, width, height). Results are cached per file path.
+        """
+        cached = self._ffprobe_cache.get(file_path)
+        if cached is not None:
+            return cached
+
+        cmd = [
+            "ffprobe",
+            "-v",
+            "error",
+            # Codec and frame size sit in the stream headers; don't let ffprobe
+            # read tens of MB of payload looking for more
+            "-analyzeduration",
+            "1M",
+            "-probesize",
+            "1M",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=codec_name,width,height",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            file_path,
+        ]
+        result = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
         )
+        output = result.stdout.strip().split("\n")
+        self._ffprobe_cache[file_path] = output
+        return output
+
+    def codec_prefetch_ffprobe(self, file_paths):
+        """
+        Run ffprobe concurrently for every file whose name lacks codec or resolution,
+        so the per-file extraction later reads from the cache instead of spawning
+        one process at a time.
+
+        Args:
+        - file_paths (list): Full paths of the files about to be processed.
+        """
+        pending = [
+            file_path
+            for file_path in file_paths
+            if file_path not in self._ffprobe_cache
+            and self.codec_needs_ffprobe(
+                self.get_filename_and_extension(file_path)[0]
+            )
+            and self.codec_is_worth_probing(file_path)
+        ]
+        if not pending:
+            return
+
+        log.info(f"Probing {len(pending)} files with ffprobe...")
+        max_workers = os.cpu_count() or 4
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, future in _submit_bounded(
+                executor, self.codec_run_ffprobe, pending, max_workers * 4
+            ):
+                try:
+                    future.result()
+                except Exception as e:
+                    log.error(f"ffprobe failed for {file_path}: {e}")
 
     def codec_extract_with_ffprobe(
         self, file_path, codec=None, resolution=None, release_format=None
@@ -285,23 +823,10 @@ class SportsMediaOrganizer:
         """
         try:
             # Only run ffprobe if codec or resolution is missing
-            if not codec or not resolution:
-                cmd = [
-                    "ffprobe",
-                    "-v",
-                    "error",
-                    "-select_streams",
-                    "v:0",
-                    "-show_entries",
-                    "stream=codec_name,width,height",
-                    "-of",
-                    "default=noprint_wrappers=1:nokey=1",
-                    file_path,
-                ]
-                result = subprocess.run(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-                output = result.stdout.strip().split("\n")
+            if (not codec or not resolution) and self.codec_is_worth_probing(
+                file_path
+            ):
+                output = self.codec_run_ffprobe(file_path)
 
                 # Extract codec and resolution from ffprobe output
                 if not codec and len(output) > 0:
@@ -351,6 +876,7 @@ class SportsMediaOrganizer:
     def release_group_match_from_yaml(self, filename):
         """
         Try to match the release group using patterns defined in the YAML file.
+        Wrapped in a per-instance lru_cache in __init__, keyed by filename.
         """
         release_groups_yaml = self.load_yaml_config("/configs/release-groups.yaml")
         return self.match_pattern_from_yaml(release_groups_yaml, filename)
@@ -361,13 +887,10 @@ class SportsMediaOrganizer:
         For example, '[GROUP]' or '-GROUP' or '_GROUP' at the end of the filename.
         """
         # Regex for extracting the release group (at the end or enclosed in brackets)
-        match = re.search(
-            r"\[([A-Za-z0-9_]+)\]|\-([A-Za-z0-9_]+)$|_([A-Za-z0-9_]+)$", filename
-        )
+        match = _RE_RELEASE_GROUP.search(filename)
         if match:
-            return (
-                match.group(1) or match.group(2) or match.group(3)
-            )  # Extract from either format: [GROUP], -GROUP, or _GROUP
+            # Extract from either format: [GROUP], -GROUP, or _GROUP
+            return match.group(1) or match.group(2)
         return None
 
     def release_group_is_in_yaml(self, release_group):
@@ -375,36 +898,79 @@ class SportsMediaOrganizer:
         Check if the release group is already present in the YAML file.
         """
         release_groups_yaml = self.load_yaml_config("/configs/release-groups.yaml")
-        return any(
-            release_group.lower() in [alias.lower() for alias in aliases]
-            for group, aliases in release_groups_yaml.items()
+        return release_group.lower() in self.release_group_alias_index(
+            release_groups_yaml
+        )
+
+    def release_group_alias_index(self, release_groups_yaml):
+        """
+        Return a frozenset of every lowercased release group alias.
+        Built once per loaded YAML dict and reused until the file changes.
+        """
+        cached = getattr(self, "_release_group_aliases", None)
+        if cached is not None and cached[0] is release_groups_yaml:
+            return cached[1]
+
+        aliases = frozenset(
+            alias.lower()
+            for group_aliases in release_groups_yaml.values()
+            for alias in group_aliases
         )
+        self._release_group_aliases = (release_groups_yaml, aliases)
+        return aliases
 
     def release_group_add_to_yaml(self, release_group):
         """
         Add a new release group to the release-groups.yaml file.
+        The read-modify-write runs under a lock and the file is replaced atomically,
+        so concurrent extraction threads can't interleave writes or leave it truncated.
         """
         yaml_path = "/configs/release-groups.yaml"
-        release_groups_yaml = self.load_yaml_config(yaml_path)
 
         # Skip adding groups that match common patterns or extensions
-        common_patterns = ["x264", "x265", "mp4", "mkv", "WEBRip"]
-        if any(p.lower() in release_group.lower() for p in common_patterns):
+        release_group_lower = release_group.lower()
+        if any(p in release_group_lower for p in _COMMON_RELEASE_PATTERNS):
             log.info(
                 f"Skipping common pattern '{release_group}' from being added to {yaml_path}"
             )
             return
 
-        # Add the new release group to the YAML dictionary
-        release_groups_yaml[release_group] = [release_group]
+        with self._release_group_lock:
+            cached_yaml = self.load_yaml_config(yaml_path)
+            known_aliases = self.release_group_alias_index(cached_yaml)
 
-        # Write the updated YAML dictionary back to the file
-        try:
-            with open(yaml_path, "w", encoding="utf-8") as f:
-                yaml.dump(release_groups_yaml, f)
+            # The cached mapping is read-only; build the updated dict from a shallow copy
+            release_groups_yaml = dict(cached_yaml)
+            release_groups_yaml[release_group] = [release_group]
+
+            # Write to a temp file next to the target, then swap it into place
+            tmp_path = f"{yaml_path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    yaml.dump(
+                        release_groups_yaml,
+                        f,
+                        Dumper=SafeDumper,
+                        default_flow_style=False,
+                    )
+                os.replace(tmp_path, yaml_path)
+            except Exception as e:
+                log.error(f"Failed to add release group to {yaml_path}: {e}")
+                return
+
+            # Refresh the caches with what we just wrote instead of re-parsing it
+            updated_yaml = MappingProxyType(release_groups_yaml)
+            self._yaml_cache[yaml_path] = (
+                os.stat(yaml_path).st_mtime_ns,
+                updated_yaml,
+            )
+            self._pattern_regex_cache.pop(id(cached_yaml), None)
+            self.release_group_match_from_yaml.cache_clear()
+            self._release_group_aliases = (
+                updated_yaml,
+                known_aliases | {release_group_lower},
+            )
             log.info(f"Added new release group '{release_group}' to {yaml_path}")
-        except Exception as e:
-            log.error(f"Failed to add release group to {yaml_path}: {e}")
 
     ############################
     # FILE EXTENSION FLOWS     #
@@ -440,16 +1006,17 @@ class SportsMediaOrganizer:
     def extension_is_blocked(self, extension):
         """
         Sub-method to check if the file extension is listed in the blocked extensions in the config.
+        Accepts the extension with or without its leading dot.
         """
-        return extension.lower() in self.config.get("block_extensions", [])
+        return extension.lower().lstrip(".") in self._blocked_extensions
 
     def extension_is_allowed(self, extension):
         """
         Sub-method to check if the file extension is listed in the allowed extensions in the config.
+        Accepts the extension with or without its leading dot.
         """
-        allowed_extensions = self.config.get("allowed_extensions", [])
         if self.config.get("allowlist_extensions", True):
-            return extension in allowed_extensions
+            return extension.lower().lstrip(".") in self._allowed_extensions
         return True
 
     ###############
@@ -467,13 +1034,13 @@ class SportsMediaOrganizer:
 
         # Step 2: Extract and handle special cases for episode_part (e.g., 2012-04-02a -> part-01)
         filename, episode_part = self.episode_title_extract_part_number(filename)
-        slots["episode_part"] = episode_part  # Set episode_part in the slots
+        slots.episode_part = episode_part  # Set episode_part in the slots
 
         # Step 3: Apply global filters to clean up unwanted text
         filename = self.apply_global_filters(filename)
 
         # Step 4: Extract event name from filename (and set it in the slots)
-        slots["event_name"] = self.episode_title_extract_event_name_from_filename(
+        slots.event_name = self.episode_title_extract_event_name_from_filename(
             filename
         )
 
@@ -499,7 +1066,7 @@ class SportsMediaOrganizer:
 
         if not event_name:
             # Try using regex if wildcard match fails
-            event_name_match = re.search(r"([A-Za-z\s]+)", filename)
+            event_name_match = _RE_WORDS.search(filename)
             if event_name_match:
                 event_name = event_name_match.group(1).strip()
 
@@ -512,14 +1079,14 @@ class SportsMediaOrganizer:
         Returns a tuple: cleaned filename and episode part string.
         """
         part_number = ""
-        part_match = re.search(r"(\d{4}-\d{2}-\d{2})([a-zA-Z])?", filename)
+        part_match = _scan_date_part(filename)
         if part_match:
-            part_letter = part_match.group(2)
+            matched_text, date_text, part_letter = part_match
             if part_letter:
                 # Convert 'a' -> part-01, 'b' -> part-02, etc.
-                part_number = f"part-{ord(part_letter.lower()) - 96:02d}"
+                part_number = _PART_LABELS[part_letter]
                 filename = filename.replace(
-                    part_match.group(0), part_match.group(1)
+                    matched_text, date_text
                 )  # Remove the part number from the filename
 
         return filename, part_number
@@ -530,23 +1097,22 @@ class SportsMediaOrganizer:
         This leaves only the episode title in the filename.
         """
         known_elements = [
-            slots.get("league_name", ""),
-            slots.get("event_name", ""),
-            slots.get("air_year", ""),
-            slots.get("air_month", ""),
-            slots.get("air_day", ""),
-            slots.get("codec"),
-            slots.get("resolution"),
-            slots.get("release_format"),
-            slots.get("release_group"),
+            slots.league_name,
+            slots.event_name,
+            slots.air_year,
+            slots.air_month,
+            slots.air_day,
+            slots.codec,
+            slots.resolution,
+            slots.release_format,
+            slots.release_group,
         ]
 
-        title = filename
-        for element in known_elements:
-            if element:
-                title = title.replace(element, "")
+        elements = tuple(element for element in known_elements if element)
+        if not elements:
+            return filename
 
-        return title
+        return _known_components_regex(elements).sub("", filename)
 
     def episode_title_clean(self, title):
         """
@@ -554,10 +1120,10 @@ class SportsMediaOrganizer:
         Remove unwanted characters and normalize the title format.
         """
         # Replace any non-alphanumeric characters (e.g., spaces, periods, underscores) with dashes
-        title = self.clean_text(title).replace(" ", "-").replace(".", "-")
+        title = self.clean_text(title).translate(_TITLE_TRANS)
 
         # Remove leading/trailing dashes and multiple dashes
-        title = re.sub(r"-+", "-", title).strip("-")
+        title = _RE_MULTI_DASH.sub("-", title).strip("-")
 
         return title
 
@@ -586,13 +1152,11 @@ class SportsMediaOrganizer:
         Extract episode part from the filename by identifying letters following dates.
         Returns the part number in string form (e.g., 'part-01').
         """
-        part_match = re.search(r"(\d{4}-\d{2}-\d{2})([a-zA-Z])?", filename)
+        part_match = _scan_date_part(filename)
         if part_match:
-            part_letter = part_match.group(2)
+            part_letter = part_match[2]
             if part_letter:
-                return (
-                    f"part-{ord(part_letter.lower()) - 96:02d}"  # 'a' becomes part-01
-                )
+                return _PART_LABELS[part_letter]  # 'a' becomes part-01
         return ""
 
     def episode_part_apply_yaml_overrides(self, filename, episode_part):
@@ -601,13 +1165,35 @@ class SportsMediaOrganizer:
         If a match is found, it overrides the current episode part.
         """
         # If overrides exist for certain patterns, apply them here
-        yaml_overrides = self.load_yaml_config("episode_parts.yaml")
-        for key, patterns in yaml_overrides.items():
-            for pattern in patterns:
-                if re.search(pattern, filename, re.IGNORECASE):
-                    return key
+        for key, pattern in self._episode_part_rules:
+            if pattern.search(filename):
+                return key
         return episode_part
 
+    def episode_part_compile_rules(self, yaml_path):
+        """
+        Load episode_parts.yaml (if present) and compile each key's patterns into
+        a single case-insensitive regex. Patterns that can't be embedded (see
+        match_is_combinable) get a rule of their own right after their key's.
+        Returns a list of (key, pattern) tuples.
+        """
+        if not os.path.isfile(yaml_path):
+            return []
+
+        rules = []
+        for key, patterns in self.load_yaml_config(yaml_path).items():
+            combinable = []
+            separate = []
+            for pattern in self.match_compile_each(key, patterns):
+                if self.match_is_combinable(pattern.pattern, pattern):
+                    combinable.append(f"(?:{pattern.pattern})")
+                else:
+                    separate.append((key, pattern))
+            if combinable:
+                rules.append((key, re.compile("|".join(combinable), re.IGNORECASE)))
+            rules.extend(separate)
+        return rules
+
     def episode_part_format(self, episode_part):
         """
         Format the episode part for consistency (e.g., 'part-01').
@@ -640,9 +1226,7 @@ class SportsMediaOrganizer:
 
         # Step 5: If event name is unknown or blank, do not include it as a slot
         if not event_name or event_name == "Unknown":
-            slots.pop(
-                "event_name", None
-            )  # Remove event_name from slots if it's unknown
+            slots.event_name = ""  # Clear event_name from slots if it's unknown
             return None
 
         return event_name
@@ -652,19 +1236,35 @@ class SportsMediaOrganizer:
         Try to match the event name using patterns defined in the sport-specific YAML file.
         Returns the matched event name if found, otherwise returns None.
         """
-        event_overrides = self.league_data.get("event_overrides", {})
+        filename_lower = filename.lower()
 
-        # Loop through the event overrides
-        for event, aliases in event_overrides.items():
-            for alias in aliases:
-                if alias.lower() in filename.lower():
-                    log.info(
-                        f"Event '{event}' matched using alias '{alias}' in filename."
-                    )
-                    return event
+        # Scan the flattened keyword table; the first hit in YAML order wins
+        for alias_lower, alias, event in self.event_name_keyword_table():
+            if alias_lower in filename_lower:
+                log.info(f"Event '{event}' matched using alias '{alias}' in filename.")
+                return event
 
         return None
 
+    def event_name_keyword_table(self):
+        """
+        Flatten the sport's event overrides into (lowercased alias, alias, event) tuples.
+        Rebuilt only when a different league_data mapping is loaded, so adding
+        keywords to the YAML costs nothing extra per file.
+        """
+        event_overrides = self.league_data.get("event_overrides", {})
+        cached = getattr(self, "_event_keyword_table", None)
+        if cached is not None and cached[0] is event_overrides:
+            return cached[1]
+
+        table = tuple(
+            (alias.lower(), alias, event)
+            for event, aliases in event_overrides.items()
+            for alias in aliases
+        )
+        self._event_keyword_table = (event_overrides, table)
+        return table
+
     def event_name_infer_from_filename(self, filename):
         """
         Infer the event name by searching the filename for common event patterns or using regex.
@@ -691,7 +1291,7 @@ class SportsMediaOrganizer:
         event_name = self.clean_text(event_name)
 
         # Remove year, month, and day from the event name if they are present
-        event_name = re.sub(r"\d{4}|\d{2}", "", event_name).strip()
+        event_name = _RE_YEAR_OR_TWO.sub("", event_name).strip()
 
         return event_name
 
@@ -703,138 +1303,56 @@ class SportsMediaOrganizer:
         """
         Controller method to orchestrate date and season extraction from the filename or directory.
         Returns a tuple: (air_year, air_month, air_day, season_name, part_number, confidence).
+        The extraction itself is memoized on (date_str, filename, parent directory),
+        since the year fallback only ever looks at the directory part of the path;
+        logging happens here so cache hits are logged too.
         """
-        confidence = 0  # Initialize confidence level
-
-        # Step 1: Extract the Date from the String
-        air_year, air_month, air_day, season_name, part_number, confidence = (
-            self.date_extract_date_from_string(date_str)
+        air_year, air_month, air_day, season_name, part_number, confidence, source = (
+            _date_and_season(date_str, filename, os.path.dirname(file_path))
         )
-        if air_year:
+        if source == "string":
             log.info(
                 f"Date extracted from string: {air_year}-{air_month}-{air_day} with season '{season_name}' and part '{part_number}'"
             )
-            return air_year, air_month, air_day, season_name, part_number, confidence
-
-        # Step 2: Handle Incomplete Dates (e.g., 87.04.22A -> 1987, part A)
-        air_year, air_month, air_day, part_number = self.date_handle_incomplete_date(
-            filename
-        )
-        if air_year:
-            season_name = f"Season {air_year}"
-            confidence = 70  # Confidence for handling incomplete dates
+        elif source == "incomplete":
             log.info(
                 f"Handled incomplete date format: {air_year}-{air_month}-{air_day}, Part: {part_number}"
             )
-            return air_year, air_month, air_day, season_name, part_number, confidence
-
-        # Step 3: Infer Year from Directory Structure
-        air_year, season_name = self.date_infer_year_from_directory(file_path)
-        if air_year != "Unknown":
-            confidence = 50  # Confidence for directory-based inference
+        elif source == "directory":
             log.info(
                 f"Date inferred from directory structure: Year {air_year}, Season {season_name}"
             )
-            return air_year, "", "", season_name, "", confidence
-
-        # Step 4: Fallback to Unknown
-        log.warning(
-            f"Date could not be inferred for '{file_path}'. Defaulting to 'Unknown'."
-        )
-        return "Unknown", "", "", "Unknown Season", "", confidence
+        else:
+            log.warning(f"No year found in parent directories for file: {file_path}")
+            log.warning(
+                f"Date could not be inferred for '{file_path}'. Defaulting to 'Unknown'."
+            )
+        return air_year, air_month, air_day, season_name, part_number, confidence
 
     def date_extract_date_from_string(self, date_str):
         """
         Sub-method to extract the date from a string using known formats.
-        Handles 2-digit years and part numbers.
+        Handles 2-digit years and part numbers. Delegates to a cached module-level
+        function, since the result depends only on date_str.
         """
-        air_year = air_month = air_day = season_name = part_number = ""
-        confidence = 0
-
-        if not date_str:
-            return "", "", "", "", "", confidence
-
-        # Regex to extract part number (e.g., 87.04.22A -> 1987.04.22, Part A)
-        part_number_match = re.search(
-            r"(\d{2,4}[\.\-_]\d{2}[\.\-_]\d{2})([a-zA-Z])?", date_str
-        )
-        if part_number_match:
-            date_str = part_number_match.group(1)
-            part_number = part_number_match.group(2) or ""
-
-        # List of known date formats
-        date_formats = [
-            "%Y.%m.%d",
-            "%Y-%m-%d",
-            "%d.%m.%Y",
-            "%d-%m-%Y",
-            "%Y_%m_%d",
-            "%d%m%Y",
-            "%y.%m.%d",
-            "%d.%m.%y",
-            "%d-%m-%y",  # 2-digit years (e.g., 87.04.22)
-        ]
-
-        # Try parsing the date
-        for fmt in date_formats:
-            try:
-                dt = datetime.strptime(date_str, fmt)
-
-                # Handle 2-digit years (e.g., 87 -> 1987 or 2087)
-                air_year = str(dt.year)
-                if len(air_year) == 2:
-                    air_year = (
-                        f"20{air_year}" if int(air_year) < 50 else f"19{air_year}"
-                    )
-
-                air_month = f"{dt.month:02d}" if dt.month else ""
-                air_day = f"{dt.day:02d}" if dt.day else ""
-                season_name = f"Season {air_year}"
-                confidence = 90
-                return (
-                    air_year,
-                    air_month,
-                    air_day,
-                    season_name,
-                    part_number,
-                    confidence,
-                )
-            except ValueError:
-                continue
-
-        return "", "", "", "", "", confidence
+        return _date_extract_from_string(date_str)
 
     def date_handle_incomplete_date(self, filename):
         """
         Sub-method to handle incomplete dates (e.g., 87.04.22A -> Part A).
         Handles 2-digit year formats and returns (air_year, air_month, air_day, part_number).
+        Delegates to a cached module-level function, since the result depends only on filename.
         """
-        air_year = air_month = air_day = part_number = ""
-
-        # Regex to match incomplete date formats (e.g., 87.04.22A)
-        match = re.search(r"(\d{2})\.(\d{2})\.(\d{2})([A-Za-z]?)", filename)
-        if match:
-            # Handle 2-digit year (e.g., 87 -> 1987)
-            year_prefix = "19" if int(match.group(1)) > 50 else "20"
-            air_year = year_prefix + match.group(1)
-            air_month = match.group(2)
-            air_day = match.group(3)
-            part_number = match.group(4).upper() if match.group(4) else ""
-            return air_year, air_month, air_day, part_number
-
-        return "", "", "", ""
+        return _date_handle_incomplete(filename)
 
     def date_infer_year_from_directory(self, file_path):
         """
         Sub-method to infer the year from the directory structure (e.g., parent folder names).
         Returns (air_year, season_name).
         """
-        parent_dirs = Path(file_path).parents
-        for directory in parent_dirs:
-            year_match = re.search(r"(19|20)\d{2}", str(directory))
-            if year_match:
-                air_year = year_match.group(0)
-                return air_year, f"Season {air_year}"
+        air_year = _date_year_from_directory(os.path.dirname(file_path))
+        if air_year:
+            return air_year, f"Season {air_year}"
 
         log.warning(f"No year found in parent directories for file: {file_path}")
         return "Unknown", "Unknown Season"
@@ -844,17 +1362,17 @@ class SportsMediaOrganizer:
         Sub-method to validate the extracted year against a date range in the folder name.
         If a range exists (e.g., 1984-1987), ensure that the extracted year falls within that range.
         """
-        parent_dirs = Path(file_path).parents
-        for directory in parent_dirs:
-            date_range_match = re.search(r"(19|20)\d{2}-(19|20)\d{2}", str(directory))
-            if date_range_match:
-                start_year, end_year = int(date_range_match.group(1)), int(
-                    date_range_match.group(2)
-                )
-                if start_year <= int(air_year) <= end_year:
-                    return air_year  # Valid year
-                else:
-                    return "Unknown"  # Year outside of valid range
+        # Searching the immediate directory covers every parent folder at once
+        parent_str = os.path.dirname(file_path)
+        date_range_match = _RE_YEAR_RANGE.search(parent_str)
+        if date_range_match:
+            start_year, end_year = int(date_range_match.group(1)), int(
+                date_range_match.group(2)
+            )
+            if start_year <= int(air_year) <= end_year:
+                return air_year  # Valid year
+            else:
+                return "Unknown"  # Year outside of valid range
 
         return air_year  # No range found, proceed with extracted year
 
@@ -875,7 +1393,7 @@ class SportsMediaOrganizer:
 
         # Stage 1: Clean and Normalize the Input League String
         league_str_cleaned = self.clean_text(league_str) if league_str else ""
-        log.debug(f"Cleaned league string: {league_str_cleaned}")
+        log.debug("Cleaned league string: %s", league_str_cleaned)
 
         # Stage 2: Apply Wildcard Matching (from YAML)
         league_from_wildcard = self.league_match_league_from_wildcards(
@@ -937,18 +1455,9 @@ class SportsMediaOrganizer:
         Returns:
             str: Matched league name or None if no match is found.
         """
-        wildcard_matches = self.league_data.get("wildcard_matches", [])
-        for wildcard in wildcard_matches:
-            string_contains = wildcard.get("string_contains", [])
-            if isinstance(string_contains, str):
-                string_contains = [string_contains]
-
-            # Search the filename or directory for wildcard matches
-            if any(s in league_str.lower() for s in string_contains) or any(
-                s in file_path.lower() for s in string_contains
-            ):
-                return wildcard.get("set_attr", {}).get("league_name")
-
+        haystacks = (league_str.lower(), file_path.lower())
+        for set_attr in self.wildcard_iter_matches(haystacks):
+            return set_attr.get("league_name")
         return None
 
     def league_match_league_from_overrides(self, league_str):
@@ -961,11 +1470,8 @@ class SportsMediaOrganizer:
         Returns:
             str: Matched league name or None if no match is found.
         """
-        for league, aliases in self.league_data.get("leagues", {}).items():
-            all_aliases = [league.lower()] + [alias.lower() for alias in aliases]
-            if league_str.lower() in all_aliases:
-                return league
-        return None
+        alias_to_league, _, _ = self.league_alias_index()
+        return alias_to_league.get(league_str.lower())
 
     def league_infer_league_from_directory(self, file_path):
         """
@@ -977,12 +1483,61 @@ class SportsMediaOrganizer:
         Returns:
             str: Inferred league name or 'Unknown' if no match is found.
         """
-        parent_dirs = Path(file_path).parents
-        for directory in parent_dirs:
-            for league, aliases in self.league_data.get("leagues", {}).items():
-                if any(alias.lower() in str(directory).lower() for alias in aliases):
-                    return league
-        return "Unknown"
+        # Every ancestor path is a prefix of the immediate directory, so an alias
+        # found in any parent is found here too; no need to build Path objects
+        directory = os.path.dirname(file_path)
+        _, directory_regex, league_names = self.league_alias_index()
+
+        # Sibling files share a directory, so remember the answer per directory;
+        # the memo is tied to the regex and dropped when the sport's leagues change
+        cached = getattr(self, "_league_by_directory", None)
+        if cached is None or cached[0] is not directory_regex:
+            cached = self._league_by_directory = (directory_regex, {})
+        league = cached[1].get(directory)
+        if league is not None:
+            return league
+
+        league = "Unknown"
+        if directory_regex is not None:
+            match = directory_regex.match(directory.lower())
+            if match:
+                league = league_names[int(match.lastgroup[1:])]
+        cached[1][directory] = league
+        return league
+
+    def league_alias_index(self):
+        """
+        Precompute league lookups for the loaded sport, rebuilt only when a different
+        `leagues` mapping is loaded.
+        Returns (alias_to_league, directory_regex, league_names): a dict of every lowercased league
+        name and alias to its league (first league wins on duplicates), and one regex
+        whose lookahead branches try each league's aliases in YAML order, so a single
+        scan of the directory picks the same league the per-alias loop did. The
+        regex's matching group name ("l<index>") indexes into league_names.
+        """
+        leagues = self.league_data.get("leagues", {})
+        cached = getattr(self, "_league_alias_index", None)
+        if cached is not None and cached[0] is leagues:
+            return cached[1:]
+
+        alias_to_league = {}
+        branches = []
+        league_names = tuple(leagues)
+        for i, (league, aliases) in enumerate(leagues.items()):
+            for alias in (league, *aliases):
+                alias_to_league.setdefault(alias.lower(), league)
+            if aliases:
+                alternation = "|".join(re.escape(alias.lower()) for alias in aliases)
+                branches.append(f"(?=(?s:.*?)(?:{alternation}))(?P<l{i}>)")
+
+        directory_regex = re.compile("|".join(branches)) if branches else None
+        self._league_alias_index = (
+            leagues,
+            alias_to_league,
+            directory_regex,
+            league_names,
+        )
+        return alias_to_league, directory_regex, league_names
 
     def league_match_league_using_regex(self, league_str):
         """
@@ -1005,13 +1560,9 @@ class SportsMediaOrganizer:
         Clean and sanitize text by removing unwanted characters, normalizing whitespace,
         and handling special cases. This method is globally applicable.
         """
-        # Replace underscores, dots, and multiple hyphens with spaces (before conversion to dashes)
-        text = re.sub(r"[_\-.]+", " ", text)
-
-        # Remove multiple consecutive spaces and trim
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        # Replace underscores, dots, and hyphens with spaces (before conversion to dashes),
+        # then collapse runs of whitespace and trim; split() does both in one pass
+        return " ".join(text.translate(_CLEAN_TRANS).split())
 
     def prompt_directory(self, prompt_msg, create=False):
         dir_path = Prompt.ask(prompt_msg)
@@ -1028,30 +1579,28 @@ class SportsMediaOrganizer:
         Construct the new file path and filename based on the extracted slots and configuration settings.
         """
         # Base variables
-        league_name = slots.get("league_name", "UNKNOWN")
-        season_name = slots.get("season_name", "Season Unknown")
-        event_name = slots.get("event_name", "")
+        league_name = slots.league_name
+        season_name = slots.season_name
+        event_name = slots.event_name
         air_date = ""
 
         # Build air date string
-        if slots.get("air_year") and slots.get("air_month") and slots.get("air_day"):
-            air_date = f"{slots['air_year']}-{slots['air_month']}-{slots['air_day']}"
-        elif slots.get("air_year"):
-            air_date = slots["air_year"]
+        if slots.air_year and slots.air_month and slots.air_day:
+            air_date = f"{slots.air_year}-{slots.air_month}-{slots.air_day}"
+        elif slots.air_year:
+            air_date = slots.air_year
 
         # File metadata (resolution, release format, codec)
-        resolution = slots.get("resolution", "")
-        release_format = slots.get("release_format", "")
-        codec = slots.get("codec", "")
-        release_group = slots.get("release_group", "")
-        episode_part = slots.get("episode_part", "")
-        episode_title = slots.get("episode_title", "")
-        extension = slots.get(
-            "extension_name", "unknown"
-        )  # Fallback if no extension is found
+        resolution = slots.resolution
+        release_format = slots.release_format
+        codec = slots.codec
+        release_group = slots.release_group
+        episode_part = slots.episode_part
+        episode_title = slots.episode_title
+        extension = slots.extension_name or "unknown"  # Fallback if no extension is found
 
         # Sport Category (optional organization based on sport)
-        sport_category = slots.get("sport_category", "Sports")
+        sport_category = slots.sport_category or "Sports"
 
         # Destination folder construction
         dest_folder = os.path.join(
@@ -1103,28 +1652,35 @@ class SportsMediaOrganizer:
 
         return dest_folder, new_filename
 
-    def rename_and_hardlink(self, src, dest_folder, new_filename):
+    def rename_and_hardlink(
+        self, src, dest_folder, new_filename, slots=None, confidence=None
+    ):
         """
         Hardlink or move the file to the destination with the new filename.
+        In dry run mode the slots and confidence are kept with the planned action
+        so the report doesn't have to extract them again.
         """
         dest_path = os.path.join(dest_folder, new_filename)
 
         if self.dry_run:
-            self.dry_run_actions.append((src, dest_path))
+            self.dry_run_actions.append((src, dest_path, slots, confidence))
             log.info(f"Dry Run - Planned: {src} -> {dest_path}")
-            self.processed_files += 1
+            self.processed_files.append(src)
         else:
-            os.makedirs(dest_folder, exist_ok=True)
+            self.file_ensure_dest_folder(dest_folder)
             try:
-                if not os.path.exists(dest_path):
-                    if self.config.get("hardlink_or_move", "hardlink") == "hardlink":
-                        os.link(src, dest_path)
-                    else:
-                        os.rename(src, dest_path)
-                    log.info(f"Processed: {src} -> {dest_path}")
-                    self.processed_files += 1
+                if self.config.get("hardlink_or_move", "hardlink") == "hardlink":
+                    # os.link refuses to overwrite, so the kernel reports collisions for us
+                    self.file_link(src, dest_path)
+                elif os.path.exists(dest_path):
+                    # os.rename would silently replace an existing file on POSIX
+                    raise FileExistsError(dest_path)
                 else:
-                    log.warning(f"File already exists: {dest_path}")
+                    self.file_move(src, dest_path)
+                log.info(f"Processed: {src} -> {dest_path}")
+                self.processed_files.append(src)
+            except FileExistsError:
+                log.warning(f"File already exists: {dest_path}")
             except Exception as e:
                 log.error(f"Failed to process {src} to {dest_path}: {e}")
                 self.failed_files.append(src)
@@ -1142,32 +1698,27 @@ class SportsMediaOrganizer:
         """
         report_file = "dry_run_report.txt"
         try:
-            with open(report_file, "w", encoding="utf-8") as f:
-                f.write("Dry Run Report - Planned Conversions\n")
-                f.write("====================================\n\n")
-                for src, dest in self.dry_run_actions:
-                    # Extract slots and confidence
-                    slots, confidence = self.extract_slots(src)
+            # Each entry is joined and encoded once, then goes through a large buffer
+            with open(report_file, "wb", buffering=_REPORT_BUFFER_SIZE) as f:
+                f.write(
+                    b"Dry Run Report - Planned Conversions\n"
+                    b"====================================\n\n"
+                )
+                for src, dest, slots, confidence in self.dry_run_actions:
+                    lines = [f"Source: {src}\n", f"Destination: {dest}\n"]
 
                     # Handle case where slots extraction fails (slots is None)
                     if slots is None:
-                        f.write(f"Source: {src}\n")
-                        f.write(f"Destination: {dest}\n")
-                        f.write("Error: Failed to extract slots for this file.\n")
-                        f.write("--------------------------------------------------\n")
-                        continue
-
-                    # Write the source, destination, and confidence
-                    f.write(f"Source: {src}\n")
-                    f.write(f"Destination: {dest}\n")
-                    f.write(f"Confidence: {confidence}%\n")
-                    f.write("Slots:\n")
-
-                    # Write slot key-value pairs
-                    for key, value in slots.items():
-                        f.write(f"  {key}: {value}\n")
+                        lines.append("Error: Failed to extract slots for this file.\n")
+                    else:
+                        # Write the confidence and slot key-value pairs
+                        lines.append(f"Confidence: {confidence}%\nSlots:\n")
+                        lines.extend(
+                            f"  {key}: {value}\n" for key, value in slots.items()
+                        )
 
-                    f.write("--------------------------------------------------\n")
+                    lines.append("--------------------------------------------------\n")
+                    f.write("".join(lines).encode("utf-8"))
 
             log.info(f"Dry run report written to '{report_file}'")
         except Exception as e:
@@ -1221,10 +1772,10 @@ class SportsMediaOrganizer:
         Sub-method to calculate the confidence for an individual slot based on its presence and validity.
         Returns partial credit for incomplete date components when the year is present.
         """
-        value = slots.get(slot_name)
+        value = getattr(slots, slot_name, None)
         if isinstance(value, str) and value.lower() != "unknown" and value != "":
             return weight
-        elif slot_name in ["air_month", "air_day"] and slots.get("air_year"):
+        elif slot_name in ["air_month", "air_day"] and slots.air_year:
             return weight * 0.5  # Partial credit for incomplete date
         return 0
 
@@ -1249,13 +1800,17 @@ class SportsMediaOrganizer:
         Perform pre-run substitutions from YAML files (global and sport-specific).
         Replaces known patterns in the filename based on 'pre_run_filename_substitutions'.
         """
-        substitutions = self.config.get("pre_run_filename_substitutions", [])
-        for sub in substitutions:
-            original = sub.get("original")
-            replace = sub.get("replace", "")
-            if original:
-                filename = re.sub(original, replace, filename, flags=re.IGNORECASE)
-        log.debug(f"Filename after substitutions: {filename}")
+        filename = self.pre_run_substitute(filename)
+        log.debug("Filename after substitutions: %s", filename)
+        return filename
+
+    def pre_run_substitute(self, filename):
+        """
+        Apply the compiled substitutions in config order. Pure (nothing is logged),
+        so it is wrapped in a per-instance lru_cache in __init__.
+        """
+        for pattern, replace in self._pre_run_substitutions:
+            filename = pattern.sub(replace, filename)
         return filename
 
     def apply_global_filters(self, filename):
@@ -1263,58 +1818,134 @@ class SportsMediaOrganizer:
         Apply global filters from YAML to remove unwanted elements in the filename.
         If any patterns match, the filename is filtered out.
         """
-        filters = self.config.get("pre_run_filter_out", [])
-        for f in filters:
-            match_pattern = f.get("match")
-            if match_pattern and re.search(
-                match_pattern, filename, flags=re.IGNORECASE
-            ):
-                log.info(f"File {filename} filtered out due to match: {match_pattern}")
+        for pattern in self._pre_run_filters:
+            match = pattern.search(filename)
+            if match:
+                log.info(
+                    f"File {filename} filtered out due to match: {match.group(0)}"
+                )
                 return None  # Filename should be filtered out
-        log.debug(f"Filename after filters: {filename}")
+        log.debug("Filename after filters: %s", filename)
         return filename
 
+    def pre_run_compile_rules(self):
+        """
+        Compile 'pre_run_filename_substitutions' and 'pre_run_filter_out' from the
+        config once, case-insensitively. Invalid patterns are logged and skipped.
+        Returns (substitutions, filters): a list of (pattern, replace) pairs applied
+        one after another in config order, and a list of patterns where every
+        combinable filter shares one alternation. Filters only answer "does any
+        match", so merging them is order-safe; substitutions are not merged because
+        a later rule may match text an earlier one rewrites or overlaps.
+        """
+        substitutions = []
+        for sub in self.config.get("pre_run_filename_substitutions", []):
+            original = sub.get("original")
+            if not original:
+                continue
+            try:
+                substitutions.append(
+                    (re.compile(original, re.IGNORECASE), sub.get("replace", ""))
+                )
+            except re.error as e:
+                log.error(f"Invalid pre-run substitution pattern '{original}': {e}")
+
+        combined, filters = [], []
+        for f in self.config.get("pre_run_filter_out", []):
+            match_pattern = f.get("match")
+            if not match_pattern:
+                continue
+            try:
+                pattern = re.compile(match_pattern, re.IGNORECASE)
+            except re.error as e:
+                log.error(f"Invalid pre-run filter pattern '{match_pattern}': {e}")
+                continue
+            if not self.match_is_combinable(match_pattern, pattern):
+                filters.append(pattern)
+            else:
+                combined.append(f"(?:{match_pattern})")
+        if combined:
+            filters.insert(0, re.compile("|".join(combined), re.IGNORECASE))
+
+        return substitutions, filters
+
     def apply_sport_overrides(self, slots, filename, file_path):
         """
         Apply per-sport overrides and wildcard matches from YAML files,
         modifying slots based on matched patterns (e.g., for leagues, events, etc.).
         Uses filename, event name, episode title, and file path for more robust matching.
         """
-        sport_overrides = self.league_data
-        wildcard_matches = sport_overrides.get("wildcard_matches", [])
+        # Search in the filename, event_name, episode_title, and file_path for wildcard matches
+        haystacks = (
+            filename.lower(),
+            slots.event_name.lower(),
+            slots.episode_title.lower(),
+            file_path.lower(),
+        )
+        for set_attr in self.wildcard_iter_matches(haystacks):
+            for key, value in set_attr.items():
+                if key == "remove_from_filename":
+                    # Remove specified text from episode_title and event_name
+                    slots.episode_title = (slots.episode_title or "").replace(value, "")
+                    slots.event_name = (slots.event_name or "").replace(value, "")
+                elif key == "single_season" and value:
+                    # If specified, set the season to "Season 01"
+                    slots.season_name = "Season 01"
+                else:
+                    # Apply other wildcard set_attr values to the slots
+                    if key in Slots.__slots__:
+                        setattr(slots, key, value)
+                    else:
+                        log.warning(f"Ignoring unknown slot '{key}' in set_attr")
+
+        return slots
+
+    def wildcard_iter_matches(self, haystacks):
+        """
+        Yield the set_attr of every wildcard whose string_contains appears in any of
+        the (already lowercased) haystacks, in YAML order.
+        One combined regex scan rejects the common no-match case; only when it hits
+        are the individual wildcards checked.
+        """
+        prefilter, entries = self.wildcard_compile_matches()
+        if prefilter is not None and not any(map(prefilter.search, haystacks)):
+            return
+
+        for string_contains, set_attr in entries:
+            if any(s in haystack for haystack in haystacks for s in string_contains):
+                yield set_attr
 
-        event_name = slots.get("event_name", "").lower()
-        episode_title = slots.get("episode_title", "").lower()
+    def wildcard_compile_matches(self):
+        """
+        Normalize the sport's wildcard_matches into (string_contains tuple, set_attr)
+        entries plus one alternation regex over every substring. Rebuilt only when
+        a different wildcard list is loaded. The regex is None if the substrings
+        can't be combined, in which case every wildcard is checked directly.
+        """
+        wildcard_matches = self.league_data.get("wildcard_matches", [])
+        cached = getattr(self, "_wildcard_index", None)
+        if cached is not None and cached[0] is wildcard_matches:
+            return cached[1], cached[2]
 
+        entries = []
         for wildcard in wildcard_matches:
             string_contains = wildcard.get("string_contains", [])
             if isinstance(string_contains, str):
                 string_contains = [string_contains]
+            entries.append((tuple(string_contains), wildcard.get("set_attr", {})))
+        entries = tuple(entries)
 
-            # Search in the filename, event_name, episode_title, and file_path for wildcard matches
-            if (
-                any(s in filename.lower() for s in string_contains)
-                or any(s in event_name for s in string_contains)
-                or any(s in episode_title for s in string_contains)
-                or any(s in file_path.lower() for s in string_contains)
-            ):
-                for key, value in wildcard.get("set_attr", {}).items():
-                    if key == "remove_from_filename":
-                        # Remove specified text from episode_title and event_name
-                        slots["episode_title"] = (slots["episode_title"] or "").replace(
-                            value, ""
-                        )
-                        slots["event_name"] = (slots["event_name"] or "").replace(
-                            value, ""
-                        )
-                    elif key == "single_season" and value:
-                        # If specified, set the season to "Season 01"
-                        slots["season_name"] = "Season 01"
-                    else:
-                        # Apply other wildcard set_attr values to the slots
-                        slots[key] = value
+        try:
+            substrings = {s for string_contains, _ in entries for s in string_contains}
+            prefilter = (
+                re.compile("|".join(map(re.escape, substrings))) if substrings else None
+            )
+        except (re.error, TypeError) as e:
+            log.warning(f"Could not combine wildcard substrings into one regex: {e}")
+            prefilter = None
 
-        return slots
+        self._wildcard_index = (wildcard_matches, prefilter, entries)
+        return prefilter, entries
 
     #######################
     # FILE HANDLING FLOWS #
@@ -1329,77 +1960,121 @@ class SportsMediaOrganizer:
         - new_filename (str): New filename for the destination file.
         """
         # Ensure the destination directory exists
-        os.makedirs(dest_folder, exist_ok=True)
+        self.file_ensure_dest_folder(dest_folder)
 
-        dest_path = os.path.join(dest_folder, new_filename)
-
-        if os.path.exists(dest_path):
-            log.warning(f"Destination file already exists: {dest_path}. Skipping.")
-            return False
+        dest_path = f"{dest_folder}{os.sep}{new_filename}"
 
         # Based on config, either hardlink or move
         if self.config.get("hardlink_or_move", "hardlink") == "hardlink":
             try:
-                os.link(src, dest_path)
+                # os.link fails atomically on collisions, no separate exists() stat needed
+                self.file_link(src, dest_path)
                 log.info(f"Hardlinked {src} to {dest_path}")
+            except FileExistsError:
+                log.warning(f"Destination file already exists: {dest_path}. Skipping.")
+                return False
             except Exception as e:
                 log.error(f"Failed to hardlink {src} to {dest_path}: {e}")
                 return False
         else:
+            # A rename overwrites silently, so moves keep the explicit check.
+            # Claim the path under the lock so two workers can't both pass it.
+            with self._dest_lock:
+                if dest_path in self._claimed_dest_paths or os.path.exists(dest_path):
+                    log.warning(
+                        f"Destination file already exists: {dest_path}. Skipping."
+                    )
+                    return False
+                self._claimed_dest_paths.add(dest_path)
             try:
-                shutil.move(src, dest_path)
+                self.file_move(src, dest_path)
                 log.info(f"Moved {src} to {dest_path}")
             except Exception as e:
                 log.error(f"Failed to move {src} to {dest_path}: {e}")
+                # Nothing was moved, so another file may still take this name
+                with self._dest_lock:
+                    self._claimed_dest_paths.discard(dest_path)
                 return False
 
         return True
 
+    def file_link(self, src, dest_path):
+        """
+        Hardlink a file with a single link syscall. Hardlinks can't cross
+        filesystems, so on EXDEV the file is copied instead, leaving the source
+        in place just as a link would. Collisions raise FileExistsError.
+        """
+        try:
+            os.link(src, dest_path)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+        log.warning(
+            f"Cannot hardlink {src} across filesystems, copying it instead "
+            f"(uses extra disk space): {dest_path}"
+        )
+        # "xb" creates the destination exclusively, so a collision fails the same
+        # way os.link does even when another worker targets the same path
+        with open(src, "rb") as fsrc, open(dest_path, "xb") as fdst:
+            try:
+                shutil.copyfileobj(fsrc, fdst)
+            except BaseException:
+                fdst.close()
+                os.remove(dest_path)
+                raise
+        shutil.copystat(src, dest_path)
+
+    def file_move(self, src, dest_path):
+        """
+        Move a file with a single rename syscall, falling back to shutil.move
+        (copy + delete) only when the destination is on another filesystem.
+        Callers are responsible for checking that dest_path is free.
+        """
+        try:
+            os.rename(src, dest_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dest_path)
+
+    def file_ensure_dest_folder(self, dest_folder):
+        """
+        Create the destination folder once per run.
+        Files sharing a league/season folder skip the repeated makedirs stat/mkdir calls.
+        """
+        if dest_folder not in self._created_folders:
+            os.makedirs(dest_folder, exist_ok=True)
+            self._created_folders.add(dest_folder)
+
     def file_assemble_final_filename(self, slots):
         """
         Assemble the final filename based on the extracted slots and configuration.
         """
-        filename_parts = []
-
-        # League is required, flag as UNKNOWN if missing
-        league = slots.get("league_name", "Unknown").replace(" ", "-")
-        filename_parts.append(league)
-
-        # Air year, month, and day (date fields)
-        if slots.get("air_year"):
-            filename_parts.append(f"{slots['air_year']}")
-            if slots.get("air_month"):
-                filename_parts.append(f"{slots['air_month']}")
-            if slots.get("air_day"):
-                filename_parts.append(f"{slots['air_day']}")
-
-        # Event name and episode title
-        event = slots.get("event_name", "")
-        title = slots.get("episode_title", "")
-
-        if event:
-            filename_parts.append(event.replace(" ", "-"))
-        if title:
-            filename_parts.append(title.replace(" ", "-"))
-
-        # Part number, if applicable
-        if slots.get("episode_part"):
-            filename_parts.append(f"{slots['episode_part']}")
-
-        # Codec, resolution, release group (optional, based on availability)
-        if slots.get("codec"):
-            filename_parts.append(slots["codec"])
-        if slots.get("resolution"):
-            filename_parts.append(slots["resolution"])
-        if slots.get("release_group"):
-            filename_parts.append(f"{slots['release_group']}")
-
-        # File extension
-        filename_parts.append(f".{slots['extension_name']}")
+        # League is required, flag as UNKNOWN if missing. Date fields only count
+        # when there is a year; empty parts are dropped by the join below.
+        has_year = bool(slots.air_year)
+        filename_parts = (
+            slots.league_name.translate(_SPACE_TRANS),
+            slots.air_year,
+            slots.air_month if has_year else "",
+            slots.air_day if has_year else "",
+            # Event name and episode title
+            (slots.event_name or "").translate(_SPACE_TRANS),
+            (slots.episode_title or "").translate(_SPACE_TRANS),
+            # Part number, codec, resolution, release group (when available)
+            slots.episode_part,
+            slots.codec,
+            slots.resolution,
+            slots.release_group,
+            # File extension
+            f".{slots.extension_name}",
+        )
 
         # Assemble filename
-        final_filename = ".".join(part for part in filename_parts if part)
-        final_filename = re.sub(r"\.{2,}", ".", final_filename).strip(".")
+        final_filename = ".".join(filter(None, filename_parts))
+        final_filename = _RE_MULTI_DOT.sub(".", final_filename).strip(".")
 
         return final_filename
 
@@ -1408,33 +2083,45 @@ class SportsMediaOrganizer:
         Assemble the folder structure based on the slots and config (sorting by sport).
         """
         root_folder = self.config.get("root_folder", "/LibraryRoot")  # Change as needed
+        sport_folder = None
         if self.config.get("sort_by_sport", True):
-            sport_folder = slots.get("sport_category", "Unknown").replace(" ", "-")
-            league_folder = slots.get("league_name", "Unknown").replace(" ", "-")
-            season_folder = f"Season {slots.get('season_name', '01')}"
-            return os.path.join(root_folder, sport_folder, league_folder, season_folder)
-        else:
-            league_folder = slots.get("league_name", "Unknown").replace(" ", "-")
-            season_folder = f"Season {slots.get('season_name', '01')}"
-            return os.path.join(root_folder, league_folder, season_folder)
-
-    def file_process_file(self, file_path):
+            sport_folder = slots.sport_category or "Unknown"
+        league_folder = slots.league_name
+        season_name = slots.season_name
+
+        # Most files in a run share a handful of folders, so build each one once
+        key = (root_folder, sport_folder, league_folder, season_name)
+        dest_folder = self._folder_cache.get(key)
+        if dest_folder is None:
+            parts = [root_folder]
+            if sport_folder is not None:
+                parts.append(sport_folder.translate(_SPACE_TRANS))
+            parts.append(league_folder.translate(_SPACE_TRANS))
+            parts.append(f"Season {season_name}")
+            dest_folder = os.path.join(*parts)
+            self._folder_cache[key] = dest_folder
+        return dest_folder
+
+    def file_process_file(self, file_path, slots=None):
         """
         Process the file by extracting slots, assembling the filename and folder, and hardlinking or moving the file.
+        Slots extracted ahead of time (see slots_extract_batch) can be passed in to skip extraction.
+        Returns True on success, False on failure and None if the file was skipped.
         """
         try:
-            filename, extension = self.get_filename_and_extension(file_path)
-            slots = self.slots_extract_and_populate(filename, file_path, extension)
+            if slots is None:
+                filename, extension = self.get_filename_and_extension(file_path)
+                slots = self.slots_extract_and_populate(filename, file_path, extension)
 
             if not slots:
                 log.info(f"Skipping file {file_path} (filtered out or no slots)")
-                return
+                return None
 
             # Final assembly
             new_filename = self.file_assemble_final_filename(slots)
             dest_folder = self.file_assemble_folder_structure(slots)
 
-            log.debug(f"Final Path: {os.path.join(dest_folder, new_filename)}")
+            log.debug("Final Path: %s", os.path.join(dest_folder, new_filename))
 
             # Move or hardlink the file
             success = self.file_handle_hardlink_or_move(
@@ -1445,9 +2132,46 @@ class SportsMediaOrganizer:
                 log.info(f"Successfully processed {file_path}")
             else:
                 log.error(f"Failed to process {file_path}")
+            return success
 
         except Exception as e:
             log.error(f"Error processing file {file_path}: {e}")
+            return False
+
+    def file_process_batch(self, file_paths, slots_by_path=None):
+        """
+        Process many files concurrently. Once slots are known the remaining work is
+        folder creation and link/move syscalls, so threads overlap the I/O waits.
+        Results are tallied on the calling thread, so no counters are shared.
+
+        Args:
+        - file_paths (list): Full paths of the files to process.
+        - slots_by_path (dict): Optional file path -> slots from slots_extract_batch.
+
+        Returns:
+        tuple: (processed, failed, skipped) counts.
+        """
+        slots_by_path = slots_by_path or {}
+        processed = failed = skipped = 0
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        def process(file_path):
+            return self.file_process_file(file_path, slots_by_path.get(file_path))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _, future in _submit_bounded(
+                executor, process, file_paths, max_workers * 4
+            ):
+                result = future.result()
+                if result is None:
+                    skipped += 1
+                elif result:
+                    processed += 1
+                else:
+                    failed += 1
+
+        log.info(f"Processed {processed} files ({failed} failed, {skipped} skipped)")
+        return processed, failed, skipped
 
     ############
     # ASSEMBLY #
@@ -1459,20 +2183,18 @@ class SportsMediaOrganizer:
         Applies all slot information to the filename, following the predefined structure.
         """
         # Initialize filename components
-        sport_category = slots.get(
-            "sport_category", ""
-        )  # If sorting by sport is enabled
-        league_name = slots.get("league_name", "Unknown")
-        air_year = slots.get("air_year", "")
-        air_month = slots.get("air_month", "")
-        air_day = slots.get("air_day", "")
-        event_name = slots.get("event_name", "")
-        episode_title = slots.get("episode_title", "")
-        part_number = slots.get("episode_part", "")
-        codec = slots.get("codec", "")
-        resolution = slots.get("resolution", "")
-        release_group = slots.get("release_group", "")
-        extension = slots.get("extension_name", "")
+        sport_category = slots.sport_category or ""  # If sorting by sport is enabled
+        league_name = slots.league_name
+        air_year = slots.air_year
+        air_month = slots.air_month
+        air_day = slots.air_day
+        event_name = slots.event_name
+        episode_title = slots.episode_title
+        part_number = slots.episode_part
+        codec = slots.codec
+        resolution = slots.resolution
+        release_group = slots.release_group
+        extension = slots.extension_name
 
         # Step 1: Construct the folder path based on sport_category and league_name
         if self.config.get("sort_by_sport", True) and sport_category:
@@ -1481,47 +2203,29 @@ class SportsMediaOrganizer:
             dest_folder = league_name
 
         # If the season name is available, include it
-        season_name = slots.get("season_name", "")
+        season_name = slots.season_name
         if season_name:
             dest_folder = os.path.join(dest_folder, season_name)
 
-        # Step 2: Construct the filename based on available slots
-        filename = f"{league_name}"
-
-        if air_year:
-            filename += f".{air_year}"
-        if air_month:
-            filename += f".{air_month}"
-        if air_day:
-            filename += f".{air_day}"
-
-        if event_name:
-            filename += f".{event_name}-"
-
-        filename += episode_title
-
-        if part_number:
-            filename += f"-{part_number}"
-
-        if codec:
-            filename += f".{codec}"
-        if resolution:
-            filename += f".{resolution}"
+        # Step 2: Construct the filename based on available slots. Dots separate the
+        # league, date, episode, codec and resolution; the event, title and part
+        # share one dash-joined segment and the release group hangs off with a dash.
+        episode = "-".join(filter(None, (event_name, episode_title, part_number)))
+        dot_parts = (
+            league_name,
+            air_year,
+            air_month,
+            air_day,
+            episode,
+            codec,
+            resolution,
+        )
+        filename = ".".join(filter(None, dot_parts))
         if release_group:
-            filename += f"-{release_group}"
+            filename = f"{filename}-{release_group}"
 
         # Step 3: Append the file extension
-        filename += f".{extension}"
-
-        # Clean up the filename by removing redundant dashes, periods, and unknowns
-        filename = re.sub(
-            r"-+", "-", filename
-        )  # Replace multiple dashes with a single dash
-        filename = re.sub(
-            r"\.\.+", ".", filename
-        )  # Replace multiple periods with a single period
-        filename = filename.strip("-")  # Remove trailing dashes
-        filename = filename.strip(".")  # Remove trailing periods
+        filename = f"{filename}.{extension}"
 
         return dest_folder, filename
 
@@ -1549,14 +2253,14 @@ class SportsMediaOrganizer:
 
         # Simulate the dry run action (print the paths)
         if dest_folder and new_filename:
+            dest_path = os.path.join(dest_folder, new_filename)
             log.info(f"Dry Run - Would process file: {file_path}")
-            log.info(
-                f"Dry Run - Would move/hardlink to: {os.path.join(dest_folder, new_filename)}"
-            )
+            log.info(f"Dry Run - Would move/hardlink to: {dest_path}")
 
-            # Log the action into the dry run actions list for reporting
+            # Log the action into the dry run actions list for reporting. The slots
+            # object is reused for the next file, so keep a private copy.
             self.dry_run_actions.append(
-                (file_path, os.path.join(dest_folder, new_filename))
+                (file_path, dest_path, replace(slots), slots.confidence)
             )
         else:
             log.warning(
@@ -1570,31 +2274,29 @@ class SportsMediaOrganizer:
         """
         report_file = "dry_run_report.txt"
         try:
-            with open(report_file, "w", encoding="utf-8") as f:
-                f.write("Dry Run Report - Planned Conversions\n")
-                f.write("====================================\n\n")
-                for src, dest in self.dry_run_actions:
-                    filename, extension = self.get_filename_and_extension(src)
-
-                    # Extract and populate slots
-                    slots = self.slots_extract_and_populate(
-                        filename=filename,
-                        file_path=src,
-                        extension=extension,
-                        logging_enabled=False,
-                    )
-
+            # Each entry is joined and encoded once, then goes through a large buffer
+            with open(report_file, "wb", buffering=_REPORT_BUFFER_SIZE) as f:
+                write = f.write  # Bound once, called once per entry
+                write(
+                    b"Dry Run Report - Planned Conversions\n"
+                    b"====================================\n\n"
+                )
+                # Slots were captured when each action was planned
+                for src, dest, slots, confidence in self.dry_run_actions:
                     if slots:
-                        f.write(f"Source: {src}\n")
-                        f.write(f"Destination: {dest}\n")
-                        f.write(f"Confidence: {slots.get('confidence', 0)}%\n")
-                        f.write("Slots:\n")
-                        for key, value in slots.items():
-                            f.write(f"  {key}: {value}\n")
-                        f.write("--------------------------------------------------\n")
+                        lines = [
+                            f"Source: {src}\n",
+                            f"Destination: {dest}\n",
+                            f"Confidence: {confidence}%\n",
+                            "Slots:\n",
+                        ]
+                        lines.extend(
+                            f"  {key}: {value}\n" for key, value in slots.items()
+                        )
                     else:
-                        f.write(f"Skipping {src} due to slot extraction failure.\n")
-                        f.write("--------------------------------------------------\n")
+                        lines = [f"Skipping {src} due to slot extraction failure.\n"]
+                    lines.append("--------------------------------------------------\n")
+                    write("".join(lines).encode("utf-8"))
 
             log.info(f"Dry run report generated and written to '{report_file}'")
         except Exception as e:
@@ -1608,18 +2310,88 @@ class SportsMediaOrganizer:
         Match a pattern from the YAML dictionary to the filename.
         Returns the key (e.g., codec type, resolution) if a match is found.
         """
-        for key, patterns in yaml_dict.items():
+        regex, keys, leftovers = self.match_compile_yaml_patterns(yaml_dict)
+        match = regex.match(filename) if regex is not None else None
+        winner = int(match.lastgroup[1:]) if match else len(keys)
+
+        # Patterns that couldn't join the regex only matter for keys ahead of it
+        for index, patterns in leftovers:
+            if index >= winner:
+                break
             for pattern in patterns:
-                if re.search(pattern, filename, re.IGNORECASE):
-                    return key
-        return None
+                if pattern.search(filename):
+                    return keys[index]
+        return keys[winner] if match else None
+
+    def match_compile_yaml_patterns(self, yaml_dict):
+        """
+        Compile every pattern of a YAML dictionary into one regex, built once per dict.
+        Each key becomes a lookahead branch tried in dictionary order, so the first key
+        with any matching pattern still wins, exactly like the nested loop.
+        Patterns that can't be embedded (see match_is_combinable) are kept compiled
+        on their own and checked only for keys ahead of the regex's answer.
+        Returns (regex, keys, leftovers); regex is None if no pattern could be
+        combined, and leftovers is a tuple of (key index, patterns) in key order.
+        """
+        cached = self._pattern_regex_cache.get(id(yaml_dict))
+        if cached is not None and cached[0] is yaml_dict:
+            return cached[1:]
+
+        keys = tuple(yaml_dict)
+        branches = []
+        leftovers = []
+        for i, (key, patterns) in enumerate(yaml_dict.items()):
+            combinable = []
+            separate = []
+            for pattern in self.match_compile_each(key, patterns):
+                if self.match_is_combinable(pattern.pattern, pattern):
+                    combinable.append(pattern.pattern)
+                else:
+                    separate.append(pattern)
+            if combinable:
+                alternation = "|".join(f"(?:{pattern})" for pattern in combinable)
+                # Only the skip-ahead crosses newlines; user patterns keep their meaning
+                branches.append(f"(?=(?s:.*?)(?:{alternation}))(?P<k{i}>)")
+            if separate:
+                leftovers.append((i, tuple(separate)))
+
+        regex = re.compile("|".join(branches), re.IGNORECASE) if branches else None
+        leftovers = tuple(leftovers)
+        self._pattern_regex_cache[id(yaml_dict)] = (yaml_dict, regex, keys, leftovers)
+        return regex, keys, leftovers
+
+    def match_is_combinable(self, original, pattern):
+        """
+        Whether a pattern can be embedded in a larger alternation: it has no capture
+        groups (backreference numbers would shift) and it still compiles when wrapped
+        (inline flags like '(?i)' must come first).
+        """
+        if pattern.groups:
+            return False
+        try:
+            re.compile(f"(?:{original})")
+        except re.error:
+            return False
+        return True
+
+    def match_compile_each(self, key, patterns):
+        """
+        Compile a key's patterns one by one (case-insensitive), skipping and logging
+        any that are invalid so one bad entry doesn't disable the whole key.
+        """
+        compiled = []
+        for pattern in patterns or ():
+            try:
+                compiled.append(re.compile(pattern, re.IGNORECASE))
+            except (re.error, TypeError) as e:
+                log.error(f"Invalid pattern {pattern!r} for '{key}': {e}")
+        return tuple(compiled)
 
     def get_filename_and_extension(self, file_path):
         """
         Extract the filename and extension from a given file path.
         """
-        filename, extension = os.path.splitext(os.path.basename(file_path))
-        return filename, extension.lstrip(".")
+        return _split_ext(file_path)
 
     ###########
     # PROMPTS #
@@ -1660,32 +2432,53 @@ class SportsMediaOrganizer:
         self.dry_run = dry_run
         self.quarantine_unknowns = quarantine_unknowns
 
-    def prompt_for_sport(self):
+    def prompt_sport_by_directory(self, file_paths):
+        """
+        Decide the sport for every file before extraction starts, asking at most once
+        per top-level library folder (folders under the source usually hold one sport).
+        If a sport was already chosen at startup it applies to every folder, no prompts.
+
+        Returns:
+        dict: Mapping of top-level folder -> sport.
+        """
+        folders = {self.library_top_folder(file_path) for file_path in file_paths}
+        if self.selected_sport:
+            return {folder: self.selected_sport for folder in folders}
+        return {folder: self.prompt_for_sport(folder) for folder in sorted(folders)}
+
+    def prompt_for_sport(self, folder=None):
         """
         Prompts the user to select a sport from the available YAML files under 'overrides/sports/'.
         Allows the user to create a new sport if not found in the list.
+        If a folder is given, the prompt names it so the user knows which files it covers.
         """
         # Get the list of available sports from the 'overrides/sports/' directory
-        sports_folder = Path(os.getcwd()) / "overrides/sports"
-        sports_files = [f for f in sports_folder.glob("*.yaml") if f.is_file()]
-
-        # Extract the sport names from the YAML filenames
-        available_sports = [f.stem for f in sports_files]
+        # One scandir pass yields the sport names straight from the entry names
+        try:
+            with os.scandir(self._sports_dir) as entries:
+                available_sports = [
+                    entry.name[:-5]
+                    for entry in entries
+                    if entry.name.endswith(".yaml")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except OSError:
+            available_sports = []
 
         # Add an option to create a new sport
         available_sports.append("Create New")
 
         # Prompt the user to select a sport
-        sport_choice = questionary.select(
-            "Select a sport:", choices=available_sports
-        ).ask()
+        message = f"Select a sport for '{folder}':" if folder else "Select a sport:"
+        sport_choice = questionary.select(message, choices=available_sports).ask()
 
         if sport_choice == "Create New":
             # Prompt for the new sport name
             new_sport_name = questionary.text("Enter the new sport name:").ask()
 
             # Create a new YAML template for the sport in 'overrides/sports/'
-            new_sport_file = sports_folder / f"{new_sport_name}.yaml"
+            new_sport_file = os.path.join(self._sports_dir, f"{new_sport_name}.yaml")
             self.create_new_sport(new_sport_file, new_sport_name)
 
             return new_sport_name
@@ -1694,7 +2487,7 @@ class SportsMediaOrganizer:
 
     def create_new_sport(self, sport_file, sport_name):
         """
-        Creates a new sport YAML template in the 'overrides/sports/' directory.
+        Creates a new sport YAML template in the 'configs/overrides/sports/' directory.
         """
         try:
             # Create a template YAML content
@@ -1736,14 +2529,13 @@ class SportsMediaOrganizer:
         - dest_root (str): Root destination directory where the quarantine folder resides.
         """
         quarantine_folder = os.path.join(dest_root, "_REQUIRES_MANUAL_INTERVENTION")
-        os.makedirs(
-            quarantine_folder, exist_ok=True
-        )  # Ensure the quarantine folder exists
+        # Ensure the quarantine folder exists (created once per run)
+        self.file_ensure_dest_folder(quarantine_folder)
 
         dest_path = os.path.join(quarantine_folder, os.path.basename(src))
 
         try:
-            shutil.move(src, dest_path)
+            self.file_move(src, dest_path)
             log.info(f"File quarantined: {src} -> {dest_path}")
         except Exception as e:
             log.error(f"Failed to quarantine file {src}: {e}")
@@ -1755,19 +2547,14 @@ class SportsMediaOrganizer:
         it moves the file to a quarantine folder.
         """
         # Check if quarantining is enabled
-        if not self.config.get("quarantine_enabled", True):
+        if not self._quarantine_enabled:
             return False  # Skip quarantining if disabled
 
-        # Check if critical fields are missing or confidence is below threshold
-        critical_fields = ["league_name", "air_year", "episode_title"]
-        missing_critical_info = any(
-            slots.get(field, "").lower() == "unknown" for field in critical_fields
-        )
-        confidence_below_threshold = confidence < self.config.get(
-            "quarantine_threshold", 50
-        )
-
-        if missing_critical_info or confidence_below_threshold:
+        # Check the cheap confidence test first, then the critical fields
+        if confidence < self._quarantine_threshold or any(
+            (getattr(slots, field, "") or "").casefold() == "unknown"
+            for field in _QUARANTINE_CRITICAL_FIELDS
+        ):
             self.quarantine_file(src, dest_root)
             return True
 
@@ -1777,34 +2564,108 @@ class SportsMediaOrganizer:
     # LIBRARY SCANNING FLOWS #
     #############################
 
+    def library_top_folder(self, file_path):
+        """
+        Return the first folder below the source directory that contains file_path,
+        or the source directory itself for files sitting directly in it.
+        """
+        source_dir = getattr(self, "source_dir", "") or ""
+        relative = os.path.relpath(os.path.dirname(file_path), source_dir or os.sep)
+        top = relative.split(os.sep, 1)[0]
+        return source_dir if top in (".", "") else os.path.join(source_dir, top)
 
-def library_scan_directory(self, source_directory, logging_enabled=True):
-    """
-    Scans the source directory recursively to find and process media files.
-    Filters files based on allowed extensions and processes them accordingly.
-    """
-    self.files_to_process = []  # Initialize list for files to process
-    # Check if the source directory exists
-    if not os.path.isdir(source_directory):
-        log.error(f"Source directory {source_directory} does not exist.")
-        return
-
-    # Recursively walk through the directory
-    for root, _, files in os.walk(source_directory):
-        for file_name in files:
-            # Get the file extension and check if it's allowed
-            extension = self.get_filename_and_extension(file_name)[1]
-            if not self.extension_is_allowed(extension):
-                log.info(
-                    f"Skipping file {file_name} due to disallowed extension: {extension}"
+    def library_scan_directory(self, source_directory, logging_enabled=True):
+        """
+        Scans the source directory recursively to find and process media files.
+        Filters files based on allowed extensions and processes them accordingly.
+        Uses os.scandir so file/dir checks come from the cached DirEntry type info
+        instead of an extra stat() per file.
+        """
+        self.files_to_process = []  # Initialize list for files to process
+        # Check if the source directory exists
+        if not os.path.isdir(source_directory):
+            log.error(f"Source directory {source_directory} does not exist.")
+            return
+
+        # Resolve the allowlist once for the whole scan (None means allow everything)
+        allowed_extensions = (
+            self._allowed_extensions
+            if self.config.get("allowlist_extensions", True)
+            else None
+        )
+
+        # Directory listings are I/O-bound (slow on NAS/SMB shares), so each folder
+        # is scanned on a worker thread and its subfolders are submitted as found
+        max_workers = min(16, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {
+                executor.submit(
+                    self.library_scan_one_directory,
+                    source_directory,
+                    allowed_extensions,
+                    logging_enabled,
                 )
-                continue
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, files = future.result()
+                    self.files_to_process.extend(files)
+                    pending.update(
+                        executor.submit(
+                            self.library_scan_one_directory,
+                            subdir,
+                            allowed_extensions,
+                            logging_enabled,
+                        )
+                        for subdir in subdirs
+                    )
+
+        # Completion order varies between runs; keep the processing order stable
+        self.files_to_process.sort()
 
-            # Process each valid file
-            file_path = os.path.join(root, file_name)
-            if logging_enabled:
-                log.debug(f"Processing file: {file_path}")
-            self.files_to_process.append(file_path)
+    def library_scan_one_directory(
+        self, current_dir, allowed_extensions, logging_enabled=True
+    ):
+        """
+        List a single directory for library_scan_directory.
+        Skips hidden entries and files whose extension isn't in allowed_extensions
+        (None allows every extension).
+        Returns (subdirs, files): lists of full paths.
+        """
+        subdirs, files = [], []
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    # Skip hidden files and folders (.DS_Store, .git, etc.)
+                    if entry.name.startswith("."):
+                        continue
+
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+
+                    # Get the file extension and check if it's allowed
+                    extension = os.path.splitext(entry.name)[1][1:]
+                    if (
+                        allowed_extensions is not None
+                        and extension.lower() not in allowed_extensions
+                    ):
+                        log.info(
+                            f"Skipping file {entry.name} due to disallowed extension: {extension}"
+                        )
+                        continue
+
+                    # Process each valid file
+                    if logging_enabled:
+                        log.debug("Processing file: %s", entry.path)
+                    files.append(entry.path)
+        except OSError as e:
+            log.error(f"Failed to scan directory {current_dir}: {e}")
+        return subdirs, files
 
 
 if __name__ == "__main__":
@@ -1820,8 +2681,19 @@ if __name__ == "__main__":
 
         # If it's not a dry run, process each file and move/hardlink them
         if not organizer.dry_run:
-            for file_path in organizer.files_to_process:
-                organizer.file_process_file(file_path)
+            # Probe files that need ffprobe up front, in parallel
+            organizer.codec_prefetch_ffprobe(organizer.files_to_process)
+
+            # Settle the sport per folder up front so no prompt runs during extraction
+            sport_by_dir = organizer.prompt_sport_by_directory(
+                organizer.files_to_process
+            )
+
+            # Extract slots for every file concurrently, then link/move concurrently
+            extracted_slots = organizer.slots_extract_batch(
+                organizer.files_to_process, sport_by_dir=sport_by_dir
+            )
+            organizer.file_process_batch(organizer.files_to_process, extracted_slots)
 
         # If it's a dry run, generate the report of what would have happened
         if organizer.dry_run:
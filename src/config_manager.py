@@ -2,10 +2,13 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from .custom_logger import log
+from .custom_logger import SafeLoader, log
+
+# Marks a dot-notation key that is known to be absent from a config
+_MISSING = object()
 
 
 class ConfigManager:
@@ -20,10 +23,14 @@ class ConfigManager:
         Args:
             config_path (str): Path to the global configuration YAML file.
         """
+        # id(config) -> (config, {dot key: value}), flattened once per config
+        self._flat_configs: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
         self.general_config = self.load_yaml(config_path)
         self.global_overrides = self.load_yaml(
             "configs/overrides/global_overrides.yaml"
         )
+        self._flatten_config(self.general_config)
+        self._flatten_config(self.global_overrides)
         self.overrides_dir = Path("configs/overrides/sports")
         self.sport_configs = {}
         self.load_sport_configs()
@@ -42,8 +49,9 @@ class ConfigManager:
             Dict[str, Any]: Parsed YAML content.
         """
         try:
-            with open(path, "r", encoding="utf-8") as file:
-                data = yaml.safe_load(file) or {}
+            # Binary mode lets the parser decode UTF-8 itself, skipping text IO
+            with open(path, "rb") as file:
+                data = yaml.load(file, Loader=SafeLoader) or {}
                 log.debug(f"Loaded YAML configuration from {path}")
                 return data
         except FileNotFoundError:
@@ -67,6 +75,7 @@ class ConfigManager:
         for yaml_file in self.overrides_dir.glob("*.yaml"):
             sport_name = yaml_file.stem.replace("_", " ").lower()
             self.sport_configs[sport_name] = self.load_yaml(str(yaml_file))
+            self._flatten_config(self.sport_configs[sport_name])
             log.debug(f"Loaded sport-specific configuration for '{sport_name}'")
 
     def get_general(self, key: str, default: Optional[Any] = None) -> Any:
@@ -126,9 +135,7 @@ class ConfigManager:
         """
         sport = sport.lower()
         config = self.sport_configs.get(sport)
-        if config:
-            log.debug(f"Retrieved sport configuration for '{sport}'")
-        else:
+        if not config:
             log.warning(f"No configuration found for sport '{sport}'")
         return config
 
@@ -137,19 +144,42 @@ class ConfigManager:
     ) -> Any:
         """
         Helper method to retrieve a value from a config dictionary using dot notation.
+        Looks the key up in the config's flattened index, so no per-call walk is needed.
         """
-        keys = key.split(".")
-        value = config
-        try:
-            for k in keys:
-                value = value[k]
-            log.debug(f"Retrieved config '{key}': {value}")
-            return value
-        except (KeyError, TypeError):
+        value = self._flatten_config(config).get(key, _MISSING)
+        if value is _MISSING:
             log.warning(
                 f"Configuration key '{key}' not found. Using default: {default}"
             )
             return default
+        return value
+
+    def _flatten_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns a flat {dot key: value} index of a config dictionary, built once per
+        dictionary. Every level is indexed, so "quarantine" yields the nested dict
+        and "quarantine.quarantine_threshold" the leaf. Lists are not descended into.
+        """
+        cached = self._flat_configs.get(id(config))
+        if cached is not None and cached[0] is config:
+            return cached[1]
+
+        flat: Dict[str, Any] = {}
+        pending: List[Tuple[Optional[str], Dict[str, Any]]] = [(None, config)]
+        while pending:
+            prefix, node = pending.pop()
+            for k, v in node.items():
+                # A dot-notation walk splits on "." and only reaches string keys,
+                # so keys it could never reach must not shadow ones it can
+                if not isinstance(k, str) or "." in k:
+                    continue
+                full_key = k if prefix is None else f"{prefix}.{k}"
+                flat[full_key] = v
+                if isinstance(v, dict):
+                    pending.append((full_key, v))
+
+        self._flat_configs[id(config)] = (config, flat)
+        return flat
 
     def get_all_configs(self, sport: str) -> Dict[str, Dict[str, Any]]:
         """
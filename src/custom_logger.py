@@ -1,23 +1,51 @@
 # File: src/custom_logger.py
 
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+)
 from datetime import datetime
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from collections.abc import Mapping
 import atexit
+import copy
+import queue
+
+# Prefer the LibYAML C parser when PyYAML was built with it. This module imports
+# nothing else from src, so the rest of the package imports SafeLoader from here.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 from rich.logging import RichHandler
 from rich import print as console_print
 from rich.traceback import install as rich_traceback_install
-from rich.console import Console
+from rich.console import Console, ConsoleRenderable
+from rich.text import Text
 
 # Enable Rich's pretty tracebacks globally
 rich_traceback_install(show_locals=True)
 console = Console(color_system="256")
 
+# Merged logger configs keyed by (resolved path, mtime), so repeated loads skip parsing
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+
+# Level name -> logging level number, looked up once per message
+_LEVELS: Dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 def deep_merge(dict1: Dict[str, Any], dict2: Mapping[str, Any]) -> Dict[str, Any]:
     """
@@ -38,6 +66,24 @@ def deep_merge(dict1: Dict[str, Any], dict2: Mapping[str, Any]) -> Dict[str, Any
     return dict1
 
 
+class _StyledRichHandler(RichHandler):
+    """
+    RichHandler that renders a record's pre-formatted console message (emoji,
+    label and color markup) and applies the Rich style passed with it.
+    """
+
+    def render_message(
+        self, record: logging.LogRecord, message: str
+    ) -> ConsoleRenderable:
+        text = super().render_message(
+            record, getattr(record, "console_message", message)
+        )
+        style = getattr(record, "rich_style", None)
+        if style and isinstance(text, Text):
+            text.stylize(style)
+        return text
+
+
 class Logger:
     """
     Custom logger class with Rich console output and file logging capabilities.
@@ -64,6 +110,7 @@ class Logger:
         "log_rotation": True,
         "max_log_size_kb": 1024,
         "backup_count": 5,
+        "log_buffer_records": 512,
         "console_log_level": "INFO",
         "file_log_level": "DEBUG",
         "use_emojis": True,
@@ -80,12 +127,14 @@ class Logger:
         """
         self.config = self.load_config(config_path)
         self.logger: logging.Logger = logging.getLogger("sports_media_organizer")
+        self._listener: Optional[QueueListener] = None
         self._setup_logger()
         atexit.register(self.close)
 
     def load_config(self, config_path: str) -> Dict[str, Any]:
         """
         Load configuration from a YAML file.
+        The merged result is cached until the file's modification time changes.
 
         Args:
             config_path (str): Path to the configuration file
@@ -94,9 +143,16 @@ class Logger:
             Dict[str, Any]: Merged configuration dictionary
         """
         try:
-            with Path(config_path).open("r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
-            return deep_merge(self.DEFAULT_CONFIG.copy(), config or {})
+            path = Path(config_path)
+            key = (str(path.resolve()), path.stat().st_mtime_ns)
+            cached = _CONFIG_CACHE.get(key)
+            if cached is None:
+                with path.open("rb") as f:
+                    config = yaml.load(f, Loader=SafeLoader)
+                cached = deep_merge(self.DEFAULT_CONFIG.copy(), config or {})
+                _CONFIG_CACHE[key] = cached
+            # Callers may mutate their config, so never hand out the cached dict
+            return copy.deepcopy(cached)
         except Exception as e:
             console.print(
                 f"[bold red]Failed to load configuration from {config_path}: {e}. Using default settings.[/bold red]"
@@ -113,10 +169,33 @@ class Logger:
 
         self.logger.setLevel(logging.DEBUG)
 
-        self._setup_file_handler(log_file)
-        self._setup_console_handler()
+        # Console prefixes and suffixes only depend on fixed settings, build them once
+        self._fmt_cache: Dict[Tuple[str, bool, bool], Tuple[str, str]] = {
+            (level, use_emojis, prepend_label): self._build_console_affixes(
+                level, use_emojis, prepend_label
+            )
+            for level in self.EMOJIS
+            for use_emojis in (True, False)
+            for prepend_label in (True, False)
+        }
+
+        handlers = [self._setup_file_handler(log_file)]
+        console_handler = self._setup_console_handler()
+        if console_handler is not None:
+            handlers.append(console_handler)
+        # Anything below every handler's level would be dropped by all of them
+        self._min_enabled_level = min(handler.level for handler in handlers)
+
+        # Callers only enqueue records; Rich rendering and file writes happen on
+        # the listener's background thread.
+        log_queue: queue.Queue = queue.Queue(-1)
+        self.logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
 
-    def _setup_file_handler(self, log_file: Path) -> None:
+    def _setup_file_handler(self, log_file: Path) -> logging.Handler:
         """Set up the file handler for logging."""
         self.file_log_level = getattr(
             logging, self.config.get("file_log_level", "DEBUG").upper(), logging.DEBUG
@@ -131,21 +210,32 @@ class Logger:
             "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
-
-    def _setup_console_handler(self) -> None:
-        """Set up the console handler for logging."""
-        if not self.config.get("noConsole", False):
-            self.console_log_level = getattr(
-                logging,
-                self.config.get("console_log_level", "INFO").upper(),
-                logging.INFO,
-            )
-            console_handler = RichHandler(show_path=False, markup=True)
-            console_handler.setLevel(self.console_log_level)
-            console_formatter = logging.Formatter("%(message)s")
-            console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
+        self._file_handler = file_handler
+
+        # Hand records to the file in batches; errors are written out right away
+        buffered = MemoryHandler(
+            capacity=self.config.get("log_buffer_records", 512),
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        buffered.setLevel(self.file_log_level)
+        return buffered
+
+    def _setup_console_handler(self) -> Optional[logging.Handler]:
+        """Set up the console handler for logging, unless noConsole is set."""
+        if self.config.get("noConsole", False):
+            return None
+        self.console_log_level = getattr(
+            logging,
+            self.config.get("console_log_level", "INFO").upper(),
+            logging.INFO,
+        )
+        console_handler = _StyledRichHandler(show_path=False, markup=True)
+        console_handler.setLevel(self.console_log_level)
+        console_formatter = logging.Formatter("%(message)s")
+        console_handler.setFormatter(console_formatter)
+        return console_handler
 
     def format_console_message(
         self, level: str, message: str, use_emojis: bool, prepend_label: bool
@@ -162,6 +252,26 @@ class Logger:
         Returns:
             str: Formatted log message
         """
+        affixes = self._fmt_cache.get((level, use_emojis, prepend_label))
+        if affixes is None:
+            affixes = self._build_console_affixes(level, use_emojis, prepend_label)
+        prefix, suffix = affixes
+        return prefix + message + suffix
+
+    def _build_console_affixes(
+        self, level: str, use_emojis: bool, prepend_label: bool
+    ) -> Tuple[str, str]:
+        """
+        Build the (prefix, suffix) pair wrapped around console messages.
+
+        Args:
+            level (str): Log level
+            use_emojis (bool): Whether to use emojis in the output
+            prepend_label (bool): Whether to prepend the log level label
+
+        Returns:
+            Tuple[str, str]: Text placed before and after the message
+        """
         label = (
             f"{level}: "
             if prepend_label and level in ["ERROR", "WARNING", "CRITICAL"]
@@ -170,8 +280,8 @@ class Logger:
         if use_emojis and self.config.get("use_emojis", True) and level in self.EMOJIS:
             emoji = self.EMOJIS[level]
             color = self.COLOR_MAP.get(level, "white")
-            return f"[{color}]{emoji} {label}{message}[/{color}]"
-        return f"{label}{message}"
+            return f"[{color}]{emoji} {label}", f"[/{color}]"
+        return label, ""
 
     def log_message(
         self,
@@ -189,33 +299,32 @@ class Logger:
             message (str): Message to log
             use_emojis (bool): Whether to use emojis in console output
             prepend_label (bool): Whether to prepend the log level label
-            **kwargs: Additional keyword arguments for Rich console print
+            **kwargs: Optional Rich ``style`` applied to the console output
         """
+        # Bail out before any formatting when no handler would accept the level
+        log_level = _LEVELS[level]
+        if log_level < self._min_enabled_level:
+            return
+
         if self.logger is None:
             console.print(
                 f"[bold red]Logger not initialized. Message: {message}[/bold red]"
             )
             return
 
-        log_level = getattr(logging, level)
-        if self.logger.isEnabledFor(log_level):
-            formatted_message = self.format_console_message(
-                level, message, use_emojis, prepend_label
-            )
-
-            if not self.config.get("noConsole", False):
-                try:
-                    style = kwargs.pop("style", None)
-                    if style:
-                        console.print(formatted_message, style=style, **kwargs)
-                    else:
-                        console.print(formatted_message, **kwargs)
-                except Exception as e:
-                    print(f"Log message (fallback): {formatted_message}")
-                    print(f"Rich console print error: {e}")
-
-            log_method = getattr(self.logger, level.lower())
-            log_method(message)
+        formatted_message = self.format_console_message(
+            level, message, use_emojis, prepend_label
+        )
+        # The file handler writes the plain message, the console handler the
+        # formatted one; both run on the listener thread.
+        self.logger.log(
+            log_level,
+            message,
+            extra={
+                "console_message": formatted_message,
+                "rich_style": kwargs.get("style"),
+            },
+        )
 
     def debug(self, message: str, **kwargs) -> None:
         """Log a debug message."""
@@ -239,6 +348,15 @@ class Logger:
 
     def close(self) -> None:
         """Close all handlers and clean up resources."""
+        if self._listener is not None:
+            # Stopping the listener drains any records still in the queue
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.flush()
+                handler.close()
+            self._listener = None
+            # The buffer doesn't close its target, so close the log file here
+            self._file_handler.close()
         if self.logger:
             for handler in self.logger.handlers[:]:
                 handler.close()
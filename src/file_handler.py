@@ -1,13 +1,35 @@
 # src/file_handler.py
 
+import errno
 import os
 import re
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
-from src.metadata_extractor.metadata_extractor import MetadataExtractor
+from typing import Deque, Dict, Any, Iterable, List, Set, Tuple
+from src.metadata_extractor_manager import MetadataExtractor
 from src.custom_logger import log
 
+# Filename cleanup patterns, compiled once at import
+_RE_DASHES = re.compile(r"-{2,}")
+_RE_DOTS = re.compile(r"\.{2,}")
+_RE_NON_ALNUM = re.compile(r"[^\w\s]")
+_RE_WHITESPACE = re.compile(r"\s+")
+
+# Deletes the ASCII characters _RE_NON_ALNUM would remove (keeps letters, digits,
+# underscores and whitespace) in a single str.translate pass
+_SANITIZE_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(
+        ch
+        for ch in map(chr, range(128))
+        if not (ch.isalnum() or ch.isspace() or ch == "_")
+    ),
+)
+
 
 class FileHandler:
     """
@@ -15,6 +37,17 @@ class FileHandler:
     and assembles filenames and folder structures based on extracted metadata.
     """
 
+    # Filename slots after the date, in order: (metadata key, placeholder value
+    # that means "not found", whether the value needs sanitizing)
+    _FILENAME_SLOTS = (
+        ("event_name", "Unknown", True),
+        ("episode_title", "Unknown", True),
+        ("episode_part", "Unknown", True),
+        ("codec", "Unknown Codec", False),
+        ("resolution", "Unknown", False),
+        ("release_group", "Unknown", False),
+    )
+
     def __init__(
         self, config: Dict[str, Any], metadata_extractor: MetadataExtractor
     ) -> None:
@@ -27,6 +60,12 @@ class FileHandler:
         """
         self.config = config
         self.metadata_extractor = metadata_extractor
+        # Destination folders already created this run, shared by worker threads
+        self._dirs_created: Set[str] = set()
+        self._dirs_lock = threading.Lock()
+        # Destinations taken this run; os.replace and copies overwrite silently
+        self._claimed_dest_paths: Set[str] = set()
+        self._dest_lock = threading.Lock()
 
     def handle_hardlink_or_move(self, src: Path, dest: Path) -> bool:
         """
@@ -39,25 +78,54 @@ class FileHandler:
         Returns:
             bool: True if operation is successful, False otherwise.
         """
+        # Claim the destination under the lock so two workers assembling the same
+        # name can't both pass the check and overwrite each other
+        dest_key = str(dest)
+        with self._dest_lock:
+            if dest_key in self._claimed_dest_paths or dest.exists():
+                log.warning(f"Destination file already exists: {dest}. Skipping.")
+                return False
+            self._claimed_dest_paths.add(dest_key)
+
         try:
+            # Files sharing a league/season folder only create it once
+            parent_key = str(dest.parent)
+            with self._dirs_lock:
+                if parent_key not in self._dirs_created:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    self._dirs_created.add(parent_key)
+
             if self.config.get("hardlink_or_move", "move").lower() == "hardlink":
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                os.link(src, dest)
-                log.info(f"Hardlinked {src} to {dest}")
+                try:
+                    os.link(src, dest)
+                    log.info(f"Hardlinked {src} to {dest}")
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    # Hardlinks can't cross filesystems; copy so the source stays put
+                    shutil.copy2(src, dest)
+                    log.info(f"Copied {src} to {dest} (different filesystem)")
             else:
-                dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(src), str(dest))
+                try:
+                    # Same filesystem: a single rename syscall
+                    os.replace(src, dest)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(src, dest)
                 log.info(f"Moved {src} to {dest}")
             return True
         except PermissionError as e:
             log.error(f"Permission denied when relocating {src} to {dest}: {e}")
-            return False
         except OSError as e:
             log.error(f"OS error occurred when relocating {src} to {dest}: {e}")
-            return False
         except Exception as e:
             log.error(f"Failed to relocate {src} to {dest}: {e}")
-            return False
+
+        # Nothing was written, so another file may still take this destination
+        with self._dest_lock:
+            self._claimed_dest_paths.discard(dest_key)
+        return False
 
     def assemble_final_filename(self, metadata: Dict[str, Any], extension: str) -> str:
         """
@@ -87,40 +155,18 @@ class FileHandler:
         elif year != "Unknown":
             components.append(f"{year}")
 
-        # Event Name
-        event = metadata.get("event_name")
-        if event and event != "Unknown":
-            components.append(self._sanitize_component(event))
-
-        # Episode Title
-        episode_title = metadata.get("episode_title")
-        if episode_title and episode_title != "Unknown":
-            components.append(self._sanitize_component(episode_title))
-
-        # Episode Part
-        episode_part = metadata.get("episode_part")
-        if episode_part and episode_part != "Unknown":
-            components.append(self._sanitize_component(episode_part))
-
-        # Codec
-        codec = metadata.get("codec")
-        if codec and codec != "Unknown Codec":
-            components.append(codec)
-
-        # Resolution
-        resolution = metadata.get("resolution")
-        if resolution and resolution != "Unknown":
-            components.append(resolution)
-
-        # Release Group
-        release_group = metadata.get("release_group")
-        if release_group and release_group != "Unknown":
-            components.append(release_group)
+        # Event name, episode title and part, codec, resolution and release group
+        for key, unknown, sanitize in self._FILENAME_SLOTS:
+            value = metadata.get(key)
+            if value and value != unknown:
+                if sanitize:
+                    value = self._sanitize_component(value)
+                components.append(value)
 
         # Clean up redundant symbols
         filename = ".".join(components) + extension
-        filename = re.sub(r"-{2,}", "-", filename)
-        filename = re.sub(r"\.{2,}", ".", filename)
+        filename = _RE_DASHES.sub("-", filename)
+        filename = _RE_DOTS.sub(".", filename)
         filename = filename.rstrip("-.")
         log.debug(f"Assembled filename: {filename}")
         return filename
@@ -165,11 +211,14 @@ class FileHandler:
         Returns:
             str: Sanitized component string.
         """
-        # Remove non-alphanumeric characters except spaces
-        sanitized = re.sub(r"[^\w\s]", "", component)
+        # Remove non-alphanumeric characters except spaces. ASCII components take
+        # the translate table; others keep the regex for Unicode punctuation.
+        if component.isascii():
+            sanitized = component.translate(_SANITIZE_TABLE)
+        else:
+            sanitized = _RE_NON_ALNUM.sub("", component)
         # Replace spaces with underscores
-        sanitized = re.sub(r"\s+", "_", sanitized)
-        return sanitized
+        return _RE_WHITESPACE.sub("_", sanitized)
 
     def process_file(self, src: Path, metadata: Dict[str, Any]) -> bool:
         """
@@ -212,6 +261,33 @@ class FileHandler:
             log.error(f"Error processing file {src}: {e}")
             return False
 
+    def process_files(self, items: Iterable[Tuple[Path, Dict[str, Any]]]) -> List[bool]:
+        """
+        Processes many media files concurrently. Relocation is I/O-bound, so a
+        thread pool overlaps the link/rename syscalls of different files. At most
+        ``io_workers * 4`` files are in flight at once, so items are pulled lazily
+        and memory stays bounded on very large inputs.
+
+        Args:
+            items (Iterable[Tuple[Path, Dict[str, Any]]]): (src, metadata) pairs.
+
+        Returns:
+            List[bool]: The process_file result for each item, in input order.
+        """
+        max_workers = self.config.get("io_workers", 8)
+        max_in_flight = max_workers * 4
+        results: List[bool] = []
+        in_flight: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for src, metadata in items:
+                in_flight.append(executor.submit(self.process_file, src, metadata))
+                if len(in_flight) >= max_in_flight:
+                    # Results are returned in input order, so wait on the oldest
+                    results.append(in_flight.popleft().result())
+            while in_flight:
+                results.append(in_flight.popleft().result())
+        return results
+
     def validate_extension(self, extension: str) -> bool:
         """
         Validates the file extension against allowed and blocked lists.
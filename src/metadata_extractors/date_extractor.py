@@ -1,12 +1,33 @@
 # src/metadata_extractors/date_extractor.py
 
 import re
+from datetime import datetime
 from typing import Tuple, Optional, Dict, Any
 from .base_extractor import BaseExtractor, ExtractionResult
 from ..media_slots import MediaSlots
 from ..file_info import FileInfo
 from ..custom_logger import log
 
+# Every supported format is three numeric fields sharing one separator (or none),
+# so one precompiled regex replaces the per-format strptime loop.
+_DATE_RE = re.compile(r"\b(\d{2,4})([-._]?)(\d{2})\2(\d{2,4})\b")
+_YEAR_RE = re.compile(r"(19|20)\d{2}")
+
+# (separator, first field width, last field width) -> field orders to try, in the
+# order of the old strptime format list. "ymd" is year first, "dmy" day first.
+_DATE_LAYOUTS = {
+    (".", 4, 2): ("ymd",),  # %Y.%m.%d
+    ("-", 4, 2): ("ymd",),  # %Y-%m-%d
+    ("_", 4, 2): ("ymd",),  # %Y_%m_%d
+    (".", 2, 4): ("dmy",),  # %d.%m.%Y
+    ("-", 2, 4): ("dmy",),  # %d-%m-%Y
+    (".", 2, 2): ("ymd", "dmy"),  # %y.%m.%d, then %d.%m.%y
+    ("-", 2, 2): ("dmy",),  # %d-%m-%y
+}
+
+# 2-digit year -> 4-digit year, taken from strptime's %y so it can't drift from it
+_YY_TO_YYYY = tuple(datetime.strptime(f"{yy:02d}", "%y").year for yy in range(100))
+
 
 class DateExtractor(BaseExtractor):
 
@@ -21,18 +42,6 @@ class DateExtractor(BaseExtractor):
     ):
         super().__init__(general_config, sport_config)
 
-        self.date_formats = [
-            "%Y.%m.%d",
-            "%Y-%m-%d",
-            "%d.%m.%Y",
-            "%d-%m-%Y",
-            "%Y_%m_%d",
-            "%d%m%Y",
-            "%y.%m.%d",
-            "%d.%m.%y",
-            "%d-%m-%y",
-        ]
-
     def extract(self, filename: str, filepath: str) -> Tuple[Optional[str], float]:
         if (
             self.media_slots.is_filled(self.slot_name)
@@ -56,18 +65,35 @@ class DateExtractor(BaseExtractor):
         return None, 0.0
 
     def _extract_date_from_string(self, text: str) -> Optional[str]:
-        for fmt in self.date_formats:
-            match = re.search(r"\b(\d{2,4}[-._]?\d{2}[-._]?\d{2,4})\b", text)
-            if match:
-                try:
-                    date = datetime.strptime(match.group(1), fmt)
-                    return date.strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
+        match = _DATE_RE.search(text)
+        if not match:
+            return None
+
+        first, separator, month, last = match.groups()
+        if not separator:
+            # The only separator-less format is %d%m%Y; the regex may have split
+            # the eight digits differently, so re-slice them
+            digits = first + month + last
+            if len(digits) != 8:
+                return None
+            first, month, last = digits[:2], digits[2:4], digits[4:]
+            orders = ("dmy",)
+        else:
+            orders = _DATE_LAYOUTS.get((separator, len(first), len(last)), ())
+
+        for order in orders:
+            year, day = (first, last) if order == "ymd" else (last, first)
+            if len(year) == 2:
+                year = _YY_TO_YYYY[int(year)]
+            try:
+                date = datetime(int(year), int(month), int(day))
+            except ValueError:
+                continue
+            return date.strftime("%Y-%m-%d")
         return None
 
     def _infer_year_from_filepath(self, filepath: str) -> Optional[str]:
-        year_match = re.search(r"(19|20)\d{2}", filepath)
+        year_match = _YEAR_RE.search(filepath)
         if year_match:
             year = year_match.group(0)
             if 1900 <= int(year) <= datetime.now().year:
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import yaml
 from .config_manager import ConfigManager
-from .custom_logger import log
+from .custom_logger import SafeLoader, log
 import questionary
 from questionary import Choice
 from rich.console import Console
@@ -262,8 +262,8 @@ class Prompter:
         sports = []
         for yaml_file in self.sports_dir.glob("*.yaml"):
             try:
-                with yaml_file.open("r") as f:
-                    data = yaml.safe_load(f)
+                with yaml_file.open("rb") as f:
+                    data = yaml.load(f, Loader=SafeLoader)
                     sport = data.get("sport")
                     if sport and isinstance(sport, str):
                         sports.append(sport)
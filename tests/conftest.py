@@ -0,0 +1,45 @@
+# tests/conftest.py
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def smo():
+    """The sports-media-organizer.py script, imported as a module."""
+    spec = importlib.util.spec_from_file_location(
+        "sports_media_organizer", ROOT / "sports-media-organizer.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def organizer(smo):
+    """A SportsMediaOrganizer with no config loaded; tests set what they need."""
+    return smo.SportsMediaOrganizer.__new__(smo.SportsMediaOrganizer)
+
+
+class _RecordingLog:
+    """Stands in for custom_logger.log and keeps (level, message) pairs."""
+
+    def __init__(self):
+        self.records = []
+
+    def __getattr__(self, level):
+        return lambda message, *args, **kwargs: self.records.append(
+            (level, message % args if args else message)
+        )
+
+
+@pytest.fixture
+def logged(smo, monkeypatch):
+    """Capture everything the script logs during a test."""
+    recorder = _RecordingLog()
+    monkeypatch.setattr(smo, "log", recorder)
+    return recorder.records
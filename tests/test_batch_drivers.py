@@ -0,0 +1,136 @@
+# tests/test_batch_drivers.py
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.file_handler import FileHandler
+
+
+class Source:
+    """An iterable that counts how many items have been pulled from it."""
+
+    def __init__(self, items):
+        self.items = items
+        self.pulled = 0
+
+    def __iter__(self):
+        for item in self.items:
+            self.pulled += 1
+            yield item
+
+
+def test_submit_bounded_caps_in_flight_work(smo):
+    source = Source(range(200))
+    consumed = 0
+    peak = 0
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = {}
+        for item, future in smo._submit_bounded(
+            executor, lambda n: n * n, source, 8
+        ):
+            peak = max(peak, source.pulled - consumed)
+            consumed += 1
+            results[item] = future.result()
+
+    assert results == {n: n * n for n in range(200)}
+    assert peak <= 8
+
+
+def test_submit_bounded_yields_errors_with_their_item(smo):
+    def work(n):
+        if n == 3:
+            raise ValueError(n)
+        return n
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pairs = list(smo._submit_bounded(executor, work, range(6), 2))
+
+    failed = [item for item, future in pairs if future.exception()]
+    assert failed == [3]
+    assert sorted(item for item, _ in pairs) == list(range(6))
+
+
+def test_slots_extract_batch_maps_every_path(organizer):
+    organizer.source_dir = "/library"
+    organizer.slots_extract_detached = (
+        lambda filename, file_path, extension, logging_enabled, sport: (
+            filename,
+            extension,
+            sport,
+        )
+    )
+    paths = [f"/library/{folder}/ep{i}.mkv" for folder in "ab" for i in range(50)]
+
+    results = organizer.slots_extract_batch(
+        iter(paths), sport_by_dir={"/library/a": "Wrestling"}
+    )
+
+    assert results == {
+        path: (
+            path.rsplit("/", 1)[1][:-4],
+            "mkv",
+            "Wrestling" if "/a/" in path else None,
+        )
+        for path in paths
+    }
+
+
+def test_codec_prefetch_ffprobe_probes_once_and_logs_failures(organizer):
+    organizer._ffprobe_cache = {"/library/cached.mkv": []}
+    organizer.codec_needs_ffprobe = lambda filename: filename != "named"
+    organizer.codec_is_worth_probing = lambda file_path: True
+    probed = []
+    lock = threading.Lock()
+
+    def run_ffprobe(file_path):
+        with lock:
+            probed.append(file_path)
+        if file_path.endswith("broken.mkv"):
+            raise OSError("unreadable")
+
+    organizer.codec_run_ffprobe = run_ffprobe
+    paths = [f"/library/ep{i}.mkv" for i in range(40)]
+
+    organizer.codec_prefetch_ffprobe(
+        paths + ["/library/cached.mkv", "/library/named.mkv", "/library/broken.mkv"]
+    )
+
+    assert sorted(probed) == sorted(paths + ["/library/broken.mkv"])
+
+
+def test_file_process_batch_tallies_results(organizer):
+    outcomes = {"done": True, "failed": False, "skipped": None}
+    organizer.file_process_file = lambda file_path, slots: outcomes[
+        file_path.split("-")[0]
+    ]
+    paths = (
+        [f"done-{i}" for i in range(30)]
+        + [f"failed-{i}" for i in range(7)]
+        + [f"skipped-{i}" for i in range(3)]
+    )
+
+    assert organizer.file_process_batch(iter(paths)) == (30, 7, 3)
+
+
+def test_file_handler_process_files_bounds_in_flight_work(tmp_path):
+    handler = FileHandler({"io_workers": 2}, None)
+    source = Source([(tmp_path / f"ep{i}.mkv", {}) for i in range(100)])
+    completed = []
+    peak = 0
+    lock = threading.Lock()
+
+    def process_file(src, metadata):
+        nonlocal peak
+        time.sleep(0.001)
+        with lock:
+            peak = max(peak, source.pulled - len(completed))
+            completed.append(src)
+        return int(src.stem[2:]) % 3 != 0
+
+    handler.process_file = process_file
+
+    results = handler.process_files(source)
+
+    assert results == [i % 3 != 0 for i in range(100)]
+    assert peak <= 2 * 4
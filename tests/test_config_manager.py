@@ -0,0 +1,92 @@
+# tests/test_config_manager.py
+
+import random
+
+import pytest
+from src.config_manager import ConfigManager
+
+MISSING = object()
+
+
+def walk(config, key, default):
+    """The per-call dot-notation walk that the flattened index replaced."""
+    value = config
+    try:
+        for k in key.split("."):
+            value = value[k]
+        return value
+    except (KeyError, TypeError):
+        return default
+
+
+def random_config(rng, depth=0):
+    config = {}
+    for _ in range(rng.randint(0, 4)):
+        key = rng.choice(["a", "b", "c", "a.b", "", 1, "quarantine"])
+        roll = rng.random()
+        if roll < 0.4 and depth < 3:
+            config[key] = random_config(rng, depth + 1)
+        elif roll < 0.5:
+            config[key] = [{"a": 1}, "b"]
+        elif roll < 0.6:
+            config[key] = "abc"
+        else:
+            config[key] = rng.randint(0, 9)
+    return config
+
+
+def all_keys(config, prefix=()):
+    """Every dot key the config could be asked for, plus a few that don't exist."""
+    keys = {".".join(prefix + (tail,)) for tail in ("a", "zz", "")}
+    for k, v in config.items():
+        path = prefix + (str(k),)
+        keys.add(".".join(path))
+        if isinstance(v, dict):
+            keys |= all_keys(v, path)
+    return keys
+
+
+@pytest.fixture
+def manager():
+    manager = ConfigManager.__new__(ConfigManager)
+    manager._flat_configs = {}
+    return manager
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_flattened_lookup_matches_dot_notation_walk(manager, seed):
+    config = random_config(random.Random(seed))
+
+    for key in all_keys(config) | {"a.b", "a.b.c", "..", "a..b"}:
+        assert manager._get_from_config(config, key, MISSING) is walk(
+            config, key, MISSING
+        ), key
+
+
+def test_sections_and_leaves_are_both_indexed(manager):
+    config = {"quarantine": {"enabled": True, "threshold": 50}}
+
+    assert manager._get_from_config(config, "quarantine") == config["quarantine"]
+    assert manager._get_from_config(config, "quarantine.threshold") == 50
+    assert manager._get_from_config(config, "quarantine.missing", 7) == 7
+
+
+def test_index_is_rebuilt_for_a_replaced_config(manager):
+    first = {"a": 1}
+    assert manager._get_from_config(first, "a") == 1
+
+    second = {"a": 2}
+    assert manager._get_from_config(second, "a") == 2
+
+
+def test_missing_key_logs_a_warning(manager, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(
+        "src.config_manager.log.warning",
+        lambda message, **kwargs: warnings.append(message),
+    )
+
+    assert manager._get_from_config({"a": {"b": 1}}, "a.c", 5) == 5
+    assert manager._get_from_config({"a": {"b": 1}}, "a.b", 5) == 1
+
+    assert warnings == ["Configuration key 'a.c' not found. Using default: 5"]
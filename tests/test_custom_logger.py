@@ -0,0 +1,77 @@
+# tests/test_custom_logger.py
+
+import logging
+
+import custom_logger
+import pytest
+from custom_logger import Logger
+
+
+class Counted:
+    """Counts how often it is turned into a string."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "counted"
+
+
+@pytest.fixture
+def make_logger(tmp_path, monkeypatch):
+    # Logger writes to ./logs, so keep its files out of the repo
+    monkeypatch.chdir(tmp_path)
+    created = []
+
+    def make(**settings):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            "".join(f"{key}: {value}\n" for key, value in settings.items()),
+            encoding="utf-8",
+        )
+        logger = Logger(str(config_path))
+        created.append(logger)
+        return logger
+
+    yield make
+    for logger in created:
+        for handler in list(logger.logger.handlers):
+            logger.logger.removeHandler(handler)
+            handler.close()
+
+
+@pytest.fixture
+def printed(monkeypatch):
+    lines = []
+    monkeypatch.setattr(
+        custom_logger, "console_print", lambda message, **kwargs: lines.append(message)
+    )
+    return lines
+
+
+def test_every_level_is_still_printed_to_the_console(make_logger, printed):
+    logger = make_logger(file_log_level="ERROR", console_log_level="ERROR")
+
+    logger.debug("Debug: %s", 1)
+    logger.info("Info")
+
+    assert len(printed) == 2
+    assert "Debug: 1" in printed[0]
+
+
+def test_no_console_messages_below_every_handler_are_dropped(
+    make_logger, printed, caplog
+):
+    logger = make_logger(
+        file_log_level="INFO", console_log_level="INFO", noConsole=True
+    )
+    value = Counted()
+
+    with caplog.at_level(logging.DEBUG, logger="sports_media_organizer"):
+        logger.debug("Dropped: %s", value, noConsole=True)
+        logger.info("Kept: %s", value, noConsole=True)
+
+    assert value.calls == 1
+    assert printed == []
+    assert [record.getMessage() for record in caplog.records] == ["Kept: counted"]
@@ -0,0 +1,90 @@
+# tests/test_date_formats.py
+
+import itertools
+import re
+from datetime import datetime
+
+import pytest
+from src.metadata_extractors.date_extractor import DateExtractor
+
+# The strptime formats DateExtractor used to loop over, kept as the reference
+OLD_DATE_FORMATS = [
+    "%Y.%m.%d",
+    "%Y-%m-%d",
+    "%d.%m.%Y",
+    "%d-%m-%Y",
+    "%Y_%m_%d",
+    "%d%m%Y",
+    "%y.%m.%d",
+    "%d.%m.%y",
+    "%d-%m-%y",
+]
+
+
+def parse_with_strptime(text):
+    match = re.search(r"\b(\d{2,4}[-._]?\d{2}[-._]?\d{2,4})\b", text)
+    if not match:
+        return None
+    for fmt in OLD_DATE_FORMATS:
+        try:
+            return datetime.strptime(match.group(1), fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+@pytest.fixture
+def extractor():
+    return DateExtractor.__new__(DateExtractor)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("WWE.Raw.2002.04.12.mkv", "2002-04-12"),
+        ("WWE.Raw.2002-04-12.mkv", "2002-04-12"),
+        ("WWE Raw 2002_04_12.mkv", "2002-04-12"),
+        ("WWE.Raw.12.04.2002.mkv", "2002-04-12"),
+        ("WWE Raw 12-04-2002.mkv", "2002-04-12"),
+        ("WWE Raw 12042002.mkv", "2002-04-12"),
+        # 2-digit dots try yy.mm.dd first, then dd.mm.yy
+        ("WWE.Raw.02.04.12.mkv", "2002-04-12"),
+        ("WWE.Raw.87.04.22.mkv", "1987-04-22"),
+        ("WWE.Raw.22.04.87.mkv", "1987-04-22"),
+        # 2-digit dashes are only ever dd-mm-yy
+        ("WWE Raw 12-04-02.mkv", "2002-04-12"),
+        # Formats the old list never accepted
+        ("WWE Raw 12_04_02.mkv", None),
+        ("WWE Raw 12.04-02.mkv", None),
+        ("WWE Raw 120402.mkv", None),
+        ("WWE Raw 2020-13-01.mkv", None),
+    ],
+)
+def test_extract_date_from_string(extractor, text, expected):
+    assert extractor._extract_date_from_string(text) == expected
+
+
+def test_two_digit_years_pivot_like_strptime(extractor):
+    for yy in range(100):
+        expected = datetime.strptime(f"{yy:02d}", "%y").strftime("%Y")
+        assert extractor._extract_date_from_string(f"{yy:02d}.04.12") == (
+            f"{expected}-04-12"
+        )
+
+
+@pytest.mark.parametrize(
+    "first, separator, last",
+    list(
+        itertools.product(
+            ("2002", "1999", "12", "31", "87", "00", "0028"),
+            (".", "-", "_", ""),
+            ("12", "31", "29", "2002", "87", "0095"),
+        )
+    ),
+)
+def test_matches_strptime_reference(extractor, first, separator, last):
+    for month in ("02", "04", "13"):
+        text = f"Event {first}{separator}{month}{separator}{last} 720p"
+        if not separator and len(text.split()[1]) != 8:
+            continue  # strptime's %d%m%Y also took 6-7 digit runs with 1-digit fields
+        assert extractor._extract_date_from_string(text) == parse_with_strptime(text)
@@ -0,0 +1,93 @@
+# tests/test_date_parsing.py
+
+from datetime import datetime
+
+import pytest
+from src.metadata_extractors.date_extractor import DateExtractor
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        ("2002.04.12", ("2002", "04", "12")),
+        ("2002-4-5", ("2002", "04", "05")),
+        ("12.04.2002", ("2002", "04", "12")),
+        ("12-04-2002", ("2002", "04", "12")),
+        # 2-digit dots try yy.mm.dd first, then dd.mm.yy
+        ("87.04.22", ("1987", "04", "22")),
+        ("22.04.87", ("1987", "04", "22")),
+        # 2-digit dashes are only ever dd-mm-yy
+        ("12-04-02", ("2002", "04", "12")),
+        ("2000.02.29", ("2000", "02", "29")),
+        ("1900.02.29", None),
+        ("2002.13.01", None),
+        ("22041987", ("1987", "04", "22")),
+    ],
+)
+def test_date_fields(smo, date_str, expected):
+    match = smo._RE_DATE_FIELDS.match(date_str)
+    fields = (
+        smo._date_fields_from_match(match)
+        if match
+        else smo._date_fields_strptime(date_str)
+    )
+    assert fields == expected
+
+
+@pytest.mark.parametrize("yy", range(100))
+def test_two_digit_year_pivot_is_shared(smo, yy):
+    expected = datetime.strptime(f"{yy:02d}", "%y").strftime("%Y")
+    assert smo._YY_TO_YYYY[yy] == expected
+    assert smo._date_extract_from_string(f"{yy:02d}.04.12")[0] == expected
+
+    extractor = DateExtractor.__new__(DateExtractor)
+    assert extractor._extract_date_from_string(f"{yy:02d}.04.12") == (
+        f"{expected}-04-12"
+    )
+
+
+@pytest.mark.parametrize("yy", range(100))
+def test_incomplete_date_keeps_its_inline_pivot(smo, yy):
+    """The table must reproduce the branch it replaced, including 50 -> 2050."""
+    year_prefix = "19" if yy > 50 else "20"
+    expected = f"{year_prefix}{yy:02d}"
+
+    assert smo._INCOMPLETE_YY_TO_YYYY[yy] == expected
+    assert smo._date_handle_incomplete(f"Raw.{yy:02d}.04.22A.mkv")[0] == expected
+
+
+@pytest.mark.parametrize(
+    "date_str, file_path, expected, level",
+    [
+        (
+            "2002.04.12",
+            "/library/Raw.mkv",
+            ("2002", "04", "12", "Season 2002", "", 90),
+            "info",
+        ),
+        (
+            "",
+            "/library/Raw.87.04.22A.mkv",
+            ("1987", "04", "22", "Season 1987", "A", 70),
+            "info",
+        ),
+        ("", "/library/1995/Raw.mkv", ("1995", "", "", "Season 1995", "", 50), "info"),
+        ("", "/library/Raw.mkv", ("Unknown", "", "", "Unknown Season", "", 0), "warning"),
+    ],
+)
+def test_date_and_season_logs_on_cache_hits(
+    smo, organizer, logged, date_str, file_path, expected, level
+):
+    smo._date_and_season.cache_clear()
+    filename = smo._split_ext(file_path)[0]
+
+    for _ in range(2):
+        assert (
+            organizer.date_extract_date_and_season(date_str, filename, file_path)
+            == expected
+        )
+
+    assert smo._date_and_season.cache_info().hits == 1
+    levels = [record_level for record_level, _ in logged]
+    assert levels[: len(levels) // 2] == levels[len(levels) // 2 :]
+    assert levels[0] == level
@@ -0,0 +1,94 @@
+# tests/test_file_handler.py
+
+import re
+
+import pytest
+from src.file_handler import FileHandler
+
+
+@pytest.fixture
+def metadata():
+    return {
+        "league": "WWE",
+        "year": "2020",
+        "month": "01",
+        "day": "05",
+        "event_name": "Royal Rumble",
+        "season": "Season 2020",
+    }
+
+
+def make_sources(tmp_path, count):
+    sources = []
+    for i in range(count):
+        src = tmp_path / "in" / f"rumble{i}.mkv"
+        src.parent.mkdir(exist_ok=True)
+        src.write_bytes(f"video {i}".encode())
+        sources.append(src)
+    return sources
+
+
+@pytest.mark.parametrize("mode", ["move", "hardlink"])
+def test_process_files_never_overwrites_a_destination(tmp_path, metadata, mode):
+    handler = FileHandler(
+        {"destination_directory": str(tmp_path / "out"), "hardlink_or_move": mode},
+        None,
+    )
+    sources = make_sources(tmp_path, 16)
+
+    results = handler.process_files((src, metadata) for src in sources)
+
+    # Every source maps to the same name: one wins, the rest are skipped intact
+    assert results.count(True) == 1
+    winner = sources[results.index(True)]
+    dest = tmp_path / "out" / "WWE" / "Season 2020" / "WWE.2020-01-05.Royal_Rumble.mkv"
+    assert dest.read_bytes() == f"video {sources.index(winner)}".encode()
+    for src, moved in zip(sources, results):
+        assert src.exists() != (moved and mode == "move")
+
+
+def test_process_files_keeps_input_order(tmp_path, metadata):
+    handler = FileHandler({"destination_directory": str(tmp_path / "out")}, None)
+    sources = make_sources(tmp_path, 8)
+    items = [
+        (src, {**metadata, "day": f"{i + 1:02d}"}) for i, src in enumerate(sources)
+    ]
+    items.insert(3, (tmp_path / "in" / "missing.mkv", {**metadata, "day": "31"}))
+
+    results = handler.process_files(items)
+
+    assert results == [True] * 3 + [False] + [True] * 5
+
+
+def sanitize_with_regexes(component):
+    """The two-regex _sanitize_component that the translate table replaced."""
+    return re.sub(r"\s+", "_", re.sub(r"[^\w\s]", "", component))
+
+
+@pytest.mark.parametrize(
+    "component",
+    [
+        "Royal Rumble",
+        " Raw  Is War ",
+        "WrestleMania X-Seven: Part 2!",
+        "Main\tEvent\n",
+        "Café Noël",
+        "Lucha—Libre «AAA»",
+        "",
+        "___",
+    ],
+)
+def test_sanitize_component_matches_regexes(component):
+    handler = FileHandler.__new__(FileHandler)
+
+    assert handler._sanitize_component(component) == sanitize_with_regexes(component)
+
+
+def test_sanitize_component_matches_regexes_for_every_character():
+    handler = FileHandler.__new__(FileHandler)
+
+    for ch in map(chr, range(0x3000)):
+        component = f"a{ch}b {ch}"
+        assert handler._sanitize_component(component) == sanitize_with_regexes(
+            component
+        ), repr(ch)
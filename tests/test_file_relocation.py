@@ -0,0 +1,74 @@
+# tests/test_file_relocation.py
+
+import errno
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+@pytest.fixture
+def cross_device(smo, monkeypatch):
+    """Make every link and rename fail as if crossing filesystems."""
+
+    def fail(*args, **kwargs):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(smo.os, "link", fail)
+    monkeypatch.setattr(smo.os, "rename", fail)
+
+
+def test_file_link_hardlinks(organizer, tmp_path):
+    src = tmp_path / "src.mkv"
+    src.write_bytes(b"video")
+    dest = tmp_path / "dest.mkv"
+
+    organizer.file_link(str(src), str(dest))
+
+    assert os.stat(dest).st_ino == os.stat(src).st_ino
+    with pytest.raises(FileExistsError):
+        organizer.file_link(str(src), str(dest))
+
+
+def test_file_link_copies_across_filesystems(organizer, tmp_path, cross_device):
+    src = tmp_path / "src.mkv"
+    src.write_bytes(b"video")
+    dest = tmp_path / "dest.mkv"
+
+    organizer.file_link(str(src), str(dest))
+
+    assert src.read_bytes() == dest.read_bytes() == b"video"
+    assert os.stat(dest).st_ino != os.stat(src).st_ino
+
+
+def test_file_link_copy_never_overwrites(organizer, tmp_path, cross_device):
+    sources = []
+    for i in range(8):
+        src = tmp_path / f"src{i}.mkv"
+        src.write_bytes(f"video {i}".encode() * 100000)
+        sources.append(src)
+    dest = tmp_path / "dest.mkv"
+
+    def link(src):
+        try:
+            organizer.file_link(str(src), str(dest))
+            return src
+        except FileExistsError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        winners = [src for src in executor.map(link, sources) if src]
+
+    assert len(winners) == 1
+    assert dest.read_bytes() == winners[0].read_bytes()
+
+
+def test_file_move_falls_back_to_shutil(organizer, tmp_path, cross_device):
+    src = tmp_path / "src.mkv"
+    src.write_bytes(b"video")
+    dest = tmp_path / "dest.mkv"
+
+    organizer.file_move(str(src), str(dest))
+
+    assert not src.exists()
+    assert dest.read_bytes() == b"video"
@@ -0,0 +1,121 @@
+# tests/test_league_matching.py
+
+import random
+from pathlib import Path
+
+import pytest
+
+LEAGUE_DATA = {
+    "leagues": {
+        "WWE": ["wwe", "wwf", "world wrestling"],
+        "WCW": ["wcw", "nitro"],
+        "ECW": ["ecw", "extreme"],
+        "NXT": [],
+        "AEW": ["aew", "dynamite", "wrestling"],
+    },
+    "wildcard_matches": [
+        {"string_contains": "hell in a cell", "set_attr": {"league_name": "WWE"}},
+        {"string_contains": ["starrcade", "halloween havoc"], "set_attr": {}},
+        {
+            "string_contains": ["no way out", "n.w.o"],
+            "set_attr": {"league_name": "WCW", "single_season": True},
+        },
+        {"string_contains": [], "set_attr": {"league_name": "ECW"}},
+    ],
+}
+
+WORDS = [
+    "wwe",
+    "WWF",
+    "World Wrestling",
+    "nitro",
+    "Extreme",
+    "aew",
+    "dynamite",
+    "nxt",
+    "hell in a cell",
+    "Starrcade",
+    "halloween havoc",
+    "No Way Out",
+    "n.w.o",
+    "raw",
+    "1997",
+    "misc",
+    "wrestlingfan",
+]
+
+
+# The per-league / per-wildcard loops the indexes replaced
+def league_from_overrides(league_data, league_str):
+    for league, aliases in league_data.get("leagues", {}).items():
+        all_aliases = [league.lower()] + [alias.lower() for alias in aliases]
+        if league_str.lower() in all_aliases:
+            return league
+    return None
+
+
+def league_from_directory(league_data, file_path):
+    for directory in Path(file_path).parents:
+        for league, aliases in league_data.get("leagues", {}).items():
+            if any(alias.lower() in str(directory).lower() for alias in aliases):
+                return league
+    return "Unknown"
+
+
+def wildcard_matches(league_data, haystacks):
+    for wildcard in league_data.get("wildcard_matches", []):
+        string_contains = wildcard.get("string_contains", [])
+        if isinstance(string_contains, str):
+            string_contains = [string_contains]
+        if any(s in haystack for haystack in haystacks for s in string_contains):
+            yield wildcard.get("set_attr", {})
+
+
+def random_path(rng):
+    parts = [rng.choice(WORDS) for _ in range(rng.randint(0, 4))]
+    return "/" + "/".join(parts + [f"{rng.choice(WORDS)}.mkv"])
+
+
+@pytest.fixture
+def leagues(organizer):
+    organizer.league_data = LEAGUE_DATA
+    return organizer
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_directory_league_matches_parent_loop(leagues, seed):
+    rng = random.Random(seed)
+
+    for _ in range(10):
+        file_path = random_path(rng)
+        assert leagues.league_infer_league_from_directory(
+            file_path
+        ) == league_from_directory(LEAGUE_DATA, file_path), file_path
+
+
+@pytest.mark.parametrize("league_str", [*WORDS, "NXT", "aew ", "Wwe", ""])
+def test_override_league_matches_alias_loop(leagues, league_str):
+    assert leagues.league_match_league_from_overrides(
+        league_str
+    ) == league_from_overrides(LEAGUE_DATA, league_str)
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_wildcards_match_wildcard_loop(leagues, seed):
+    rng = random.Random(seed)
+    haystacks = tuple(
+        " ".join(rng.choice(WORDS) for _ in range(3)).lower() for _ in range(2)
+    )
+
+    assert list(leagues.wildcard_iter_matches(haystacks)) == list(
+        wildcard_matches(LEAGUE_DATA, haystacks)
+    )
+
+
+def test_indexes_are_rebuilt_for_new_league_data(leagues):
+    assert leagues.league_infer_league_from_directory("/nitro/ep.mkv") == "WCW"
+
+    leagues.league_data = {"leagues": {"Other": ["nitro"]}, "wildcard_matches": []}
+
+    assert leagues.league_infer_league_from_directory("/nitro/ep.mkv") == "Other"
+    assert list(leagues.wildcard_iter_matches(("hell in a cell",))) == []
@@ -0,0 +1,78 @@
+# tests/test_pre_run_rules.py
+
+import re
+
+import pytest
+
+
+def apply_sequentially(rules, filename):
+    for original, replace in rules:
+        filename = re.sub(original, replace, filename, flags=re.IGNORECASE)
+    return filename
+
+
+def compile_rules(organizer, substitutions=(), filters=()):
+    organizer.config = {
+        "pre_run_filename_substitutions": [
+            {"original": original, "replace": replace}
+            for original, replace in substitutions
+        ],
+        "pre_run_filter_out": [{"match": match} for match in filters],
+    }
+    organizer._pre_run_substitutions, organizer._pre_run_filters = (
+        organizer.pre_run_compile_rules()
+    )
+
+
+@pytest.mark.parametrize(
+    "rules, filename",
+    [
+        (
+            [("View Pack", ""), ("Pay Per View", "PPV")],
+            "WWF Pay Per View Pack 1995",
+        ),
+        ([("cd", "X"), ("abc", "Y")], "abcd"),
+        ([("_", " "), (r"\s+", " ")], "WWE_Raw__2020"),
+        ([(r"\s+", " "), ("Pay Per View", "PPV")], "WCW Pay  Per View"),
+        ([(r"(\d{4})\.(\d{2})", r"\1-\2"), ("(?i)hdtv", "")], "Raw.2020.01.HDTV"),
+    ],
+)
+def test_substitutions_match_sequential_application(organizer, rules, filename):
+    compile_rules(organizer, substitutions=rules)
+    assert organizer.apply_global_substitutions(filename) == apply_sequentially(
+        rules, filename
+    )
+
+
+def test_invalid_substitution_is_skipped(organizer):
+    compile_rules(organizer, substitutions=[("(", "x"), ("Raw", "RAW")])
+    assert organizer.apply_global_substitutions("WWE Raw") == "WWE RAW"
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("WWE Raw Sample.mkv", None),
+        ("WWE Raw trailer.mkv", None),
+        ("WWE Raw 2020 03.mkv", None),
+        ("WWE Raw.mkv", "WWE Raw.mkv"),
+    ],
+)
+def test_filters_behave_like_individual_searches(organizer, filename, expected):
+    compile_rules(
+        organizer, filters=["sample", "(?i)trailer", r"(\d{4}) \1|2020 03"]
+    )
+    assert organizer.apply_global_filters(filename) == expected
+
+
+def test_memoized_substitutions_still_log_on_cache_hits(smo, organizer, logged):
+    compile_rules(organizer, substitutions=[("_", " ")])
+    organizer.pre_run_substitute = smo.functools.lru_cache(maxsize=16)(
+        organizer.pre_run_substitute
+    )
+
+    for _ in range(3):
+        assert organizer.apply_global_substitutions("WWE_Raw") == "WWE Raw"
+
+    assert organizer.pre_run_substitute.cache_info().hits == 2
+    assert logged == [("debug", "Filename after substitutions: WWE Raw")] * 3
@@ -0,0 +1,46 @@
+# tests/test_quarantine.py
+
+import pytest
+
+
+@pytest.fixture
+def quarantine(organizer):
+    organizer._quarantine_enabled = True
+    organizer._quarantine_threshold = 50
+    organizer.quarantined = []
+    organizer.quarantine_file = lambda src, dest_root: organizer.quarantined.append(src)
+    return organizer
+
+
+def complete_slots(smo, **fields):
+    values = dict(league_name="WWE", air_year="2002", episode_title="Raw")
+    values.update(fields)
+    return smo.Slots(**values)
+
+
+@pytest.mark.parametrize("field", ["league_name", "air_year", "episode_title"])
+@pytest.mark.parametrize("value", ["Unknown", "UNKNOWN", "unknown", "uNKNOWN"])
+def test_unknown_critical_field_quarantines_in_any_case(smo, quarantine, field, value):
+    slots = complete_slots(smo, **{field: value})
+
+    assert quarantine.check_for_quarantine(slots, 100, "src.mkv", "/dest")
+    assert quarantine.quarantined == ["src.mkv"]
+
+
+def test_complete_slots_are_kept(smo, quarantine):
+    assert not quarantine.check_for_quarantine(
+        complete_slots(smo), 100, "src.mkv", "/dest"
+    )
+    assert quarantine.quarantined == []
+
+
+def test_low_confidence_quarantines(smo, quarantine):
+    assert quarantine.check_for_quarantine(complete_slots(smo), 49, "src.mkv", "/dest")
+
+
+def test_disabled_quarantine_keeps_everything(smo, quarantine):
+    quarantine._quarantine_enabled = False
+
+    assert not quarantine.check_for_quarantine(
+        complete_slots(smo, league_name="unknown"), 0, "src.mkv", "/dest"
+    )
@@ -0,0 +1,75 @@
+# tests/test_slots.py
+
+import dataclasses
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def pooled(organizer, smo):
+    organizer._slots_pool = threading.local()
+    return organizer
+
+
+def test_reset_restores_every_default(smo):
+    slots = smo.Slots()
+    for field in dataclasses.fields(slots):
+        setattr(slots, field.name, "changed")
+
+    slots.reset("mkv")
+
+    assert slots == smo.Slots(extension_name="mkv")
+
+
+def test_items_follow_declaration_order(smo):
+    slots = smo.Slots(league_name="WWE", air_year="2002")
+
+    assert list(slots.items()) == [
+        (field.name, getattr(slots, field.name)) for field in dataclasses.fields(slots)
+    ]
+
+
+def test_slots_are_reused_per_thread(pooled):
+    first = pooled.slots_initialize("mkv", logging_enabled=False)
+    first.league_name = "WWE"
+
+    second = pooled.slots_initialize("mp4", logging_enabled=False)
+
+    assert second is first
+    assert second.league_name == "Unknown"
+    assert second.extension_name == "mp4"
+
+
+def test_each_thread_gets_its_own_slots(pooled):
+    seen = []
+    barrier = threading.Barrier(4)
+
+    def worker():
+        slots = pooled.slots_initialize("mkv", logging_enabled=False)
+        barrier.wait()  # keep every thread alive so none can inherit another's
+        seen.append(slots)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(slots) for slots in seen}) == 4
+
+
+def test_detached_slots_survive_the_next_extraction(pooled):
+    def extract(filename, file_path, extension, logging_enabled, sport):
+        slots = pooled.slots_initialize(extension, logging_enabled=False)
+        slots.event_name = filename
+        return slots
+
+    pooled.slots_extract_and_populate = extract
+
+    first = pooled.slots_extract_detached("Royal Rumble", "/a.mkv", "mkv")
+    second = pooled.slots_extract_detached("Survivor Series", "/b.mp4", "mp4")
+
+    assert first is not second
+    assert (first.event_name, first.extension_name) == ("Royal Rumble", "mkv")
+    assert (second.event_name, second.extension_name) == ("Survivor Series", "mp4")
@@ -0,0 +1,100 @@
+# tests/test_yaml_patterns.py
+
+import re
+
+import pytest
+
+
+def match_sequentially(yaml_dict, filename):
+    """The nested loop match_pattern_from_yaml replaces, minus invalid patterns."""
+    for key, patterns in yaml_dict.items():
+        for pattern in patterns or ():
+            try:
+                if re.search(pattern, filename, re.IGNORECASE):
+                    return key
+            except (re.error, TypeError):
+                continue
+    return None
+
+
+YAML_DICTS = [
+    {"x264": ["x264", "h264", "avc"], "x265": ["x265", "hevc"], "AV1": ["av1"]},
+    {"720p": [r"720p?"], "1080p": [r"1080[pi]"], "4K": [r"2160p", r"\b4k\b"]},
+    # Capture groups and backreferences must not shift each other's numbering
+    {"doubled": [r"(\w)\1{3}"], "pair": [r"(ab)\1"], "plain": ["raw"]},
+    # Global inline flags can't be wrapped; the later key must not win early
+    {"inline": ["(?i)WEB-?DL"], "web": ["web"]},
+    # Invalid and non-string patterns are skipped, the key's others still count
+    {"broken": ["[", "hdtv"], "numeric": [264], "empty": [], "none": None},
+    # Anchors, dots and lookarounds keep their per-pattern meaning
+    {"start": ["^raw"], "dot": ["a.b"], "end": ["ppv$"], "behind": ["(?<=wwe)raw"]},
+]
+
+FILENAMES = [
+    "WWE.Raw.2002.04.12.x264.720p",
+    "raw.HEVC.1080i",
+    "WrestleMania.4K.AV1",
+    "aaaa.ababab",
+    "abab.raw",
+    "wwe-Web-DL",
+    "PPV.HDTV",
+    "event.264",
+    "a\nb.rawppv",
+    "wweraw",
+    "nothing to see",
+    "",
+]
+
+
+@pytest.mark.parametrize("yaml_dict", YAML_DICTS)
+@pytest.mark.parametrize("filename", FILENAMES)
+def test_combined_match_agrees_with_nested_loop(organizer, yaml_dict, filename):
+    organizer._pattern_regex_cache = {}
+
+    assert organizer.match_pattern_from_yaml(
+        yaml_dict, filename
+    ) == match_sequentially(yaml_dict, filename)
+
+
+def test_only_combinable_patterns_join_the_regex(organizer):
+    organizer._pattern_regex_cache = {}
+    yaml_dict = {"a": ["(x)\\1", "plain"], "b": ["(?i)inline"], "c": ["other"]}
+
+    regex, keys, leftovers = organizer.match_compile_yaml_patterns(yaml_dict)
+
+    assert keys == ("a", "b", "c")
+    assert [(i, [p.pattern for p in ps]) for i, ps in leftovers] == [
+        (0, ["(x)\\1"]),
+        (1, ["(?i)inline"]),
+    ]
+    assert regex.groups == 2
+    assert not regex.flags & re.DOTALL
+
+
+def test_compiled_patterns_are_reused_per_dict(organizer):
+    organizer._pattern_regex_cache = {}
+    yaml_dict = {"x264": ["x264"]}
+
+    first = organizer.match_compile_yaml_patterns(yaml_dict)
+
+    assert organizer.match_compile_yaml_patterns(yaml_dict)[0] is first[0]
+
+
+def test_episode_part_rules_agree_with_nested_loop(organizer, tmp_path):
+    organizer._yaml_cache = {}
+    yaml_path = tmp_path / "episode_parts.yaml"
+    yaml_path.write_text(
+        "part-01: ['(p)(?:art)?\\\\.?1\\\\b', 'first half']\n"
+        "part-02: ['(?i)PART\\\\.?2', '[', 'second half']\n"
+        "part-03: ['pt3']\n",
+        encoding="utf-8",
+    )
+    yaml_dict = dict(organizer.load_yaml_config(str(yaml_path)))
+    organizer._episode_part_rules = organizer.episode_part_compile_rules(
+        str(yaml_path)
+    )
+
+    for filename in ["Raw.p1", "Raw.Part.2", "Raw.second half", "Raw.pt3", "Raw"]:
+        assert organizer.episode_part_apply_yaml_overrides(
+            filename, "none"
+        ) == (match_sequentially(yaml_dict, filename) or "none")